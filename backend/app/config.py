@@ -7,6 +7,51 @@ class Settings(BaseSettings):
     SUPABASE_SERVICE_KEY: str = os.getenv("SUPABASE_SERVICE_KEY", "")
     SUPABASE_ANON_KEY: str = os.getenv("SUPABASE_ANON_KEY", "")
     
+    # Storage backend: "supabase" (REST) or "sql" (SQLite/Postgres via DATABASE_URL)
+    DATABASE_BACKEND: str = os.getenv("DATABASE_BACKEND", "supabase")
+    DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./urban_eye.db")
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    DB_CONNECT_RETRIES: int = int(os.getenv("DB_CONNECT_RETRIES", "3"))
+    DB_CONNECT_BACKOFF_SECONDS: float = float(os.getenv("DB_CONNECT_BACKOFF_SECONDS", "0.5"))
+    
+    # Readiness probe: backend check timeout and how long a result is reused
+    READINESS_TIMEOUT_SECONDS: float = float(os.getenv("READINESS_TIMEOUT_SECONDS", "2"))
+    READINESS_CACHE_SECONDS: float = float(os.getenv("READINESS_CACHE_SECONDS", "5"))
+    
+    # Backend calls: per-call timeout, read retries, circuit breaker
+    BACKEND_TIMEOUT_SECONDS: float = float(os.getenv("BACKEND_TIMEOUT_SECONDS", "5"))
+    BACKEND_READ_RETRIES: int = int(os.getenv("BACKEND_READ_RETRIES", "2"))
+    BACKEND_RETRY_BACKOFF_SECONDS: float = float(os.getenv("BACKEND_RETRY_BACKOFF_SECONDS", "0.2"))
+    BREAKER_FAILURE_THRESHOLD: int = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "5"))
+    BREAKER_RESET_SECONDS: float = float(os.getenv("BREAKER_RESET_SECONDS", "30"))
+    STALE_CACHE_ENTRIES: int = int(os.getenv("STALE_CACHE_ENTRIES", "1024"))
+    
+    # Request profiling (middleware only installed when enabled)
+    PROFILING_ENABLED: bool = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+    PROFILING_SAMPLE_RATE: float = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+    PROFILING_ADMIN_TOKEN: str = os.getenv("PROFILING_ADMIN_TOKEN", "")
+    PROFILING_INTERVAL_SECONDS: float = float(os.getenv("PROFILING_INTERVAL_SECONDS", "0.001"))
+    PROFILING_OUTPUT_DIR: str = os.getenv("PROFILING_OUTPUT_DIR", "profiles")
+    PROFILING_MAX_STORED: int = int(os.getenv("PROFILING_MAX_STORED", "100"))
+    
+    # Identical concurrent reads share one backend call; results are reused for this long
+    READ_COALESCE_WINDOW_SECONDS: float = float(os.getenv("READ_COALESCE_WINDOW_SECONDS", "0.05"))
+    
+    # Department work queues: rebuild interval and open issues an employee may hold
+    QUEUE_REFRESH_SECONDS: float = float(os.getenv("QUEUE_REFRESH_SECONDS", "30"))
+    QUEUE_MAX_OPEN_PER_EMPLOYEE: int = int(os.getenv("QUEUE_MAX_OPEN_PER_EMPLOYEE", "5"))
+    
+    # SLA rollups: retry interval for the start-up replay of the status event log
+    SLA_WARMUP_RETRY_SECONDS: float = float(os.getenv("SLA_WARMUP_RETRY_SECONDS", "5"))
+    
+    # Heatmaps: how long the issue coordinate snapshot is reused, rendered grids kept
+    HEATMAP_SNAPSHOT_SECONDS: float = float(os.getenv("HEATMAP_SNAPSHOT_SECONDS", "60"))
+    HEATMAP_CACHE_SIZE: int = int(os.getenv("HEATMAP_CACHE_SIZE", "256"))
+    
+    # Responses at least this large are brotli/gzip compressed when the client accepts it
+    COMPRESSION_MIN_BYTES: int = int(os.getenv("COMPRESSION_MIN_BYTES", "1024"))
+    
     # JWT Configuration
     JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "your-super-secret-jwt-key")
     JWT_ALGORITHM: str = "HS256"
@@ -19,6 +64,14 @@ class Settings(BaseSettings):
     # Environment
     ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
     
+    # Production server (python -m app.server)
+    WEB_HOST: str = os.getenv("WEB_HOST", "0.0.0.0")
+    WEB_PORT: int = int(os.getenv("WEB_PORT", "8000"))
+    WEB_WORKERS: int = int(os.getenv("WEB_WORKERS", "0"))  # 0 = one per CPU
+    WEB_KEEPALIVE_SECONDS: int = int(os.getenv("WEB_KEEPALIVE_SECONDS", "5"))
+    WEB_BACKLOG: int = int(os.getenv("WEB_BACKLOG", "2048"))
+    WEB_GRACEFUL_TIMEOUT_SECONDS: int = int(os.getenv("WEB_GRACEFUL_TIMEOUT_SECONDS", "30"))
+    
     # CORS
     ALLOWED_ORIGINS: list = ["http://localhost:3000", "http://127.0.0.1:3000", "*"]
     
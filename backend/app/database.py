@@ -1,15 +1,86 @@
-from supabase import create_client, Client
+import asyncio
+from typing import Optional, TYPE_CHECKING
 from app.config import settings
+from app.repositories.base import Repository
+from app.repositories.resilience import CircuitBreaker, ResilientRepository
 import logging
 
+if TYPE_CHECKING:
+    from supabase import Client
+
 logger = logging.getLogger(__name__)
 
-try:
-    supabase: Client = create_client(settings.SUPABASE_URL, settings.SUPABASE_SERVICE_KEY)
-    logger.info("Supabase connected successfully")
-except Exception as e:
-    logger.error(f"Failed to connect to Supabase: {e}")
-    supabase = None
+# Built on first use (normally in the app lifespan), not at import time,
+# so workers start fast and a failure surfaces as a real error.
+_supabase: Optional["Client"] = None
+_repository: Optional[Repository] = None
+_connected = False
+
+def get_supabase() -> "Client":
+    global _supabase
+    if _supabase is None:
+        from supabase import create_client
+        from supabase.lib.client_options import ClientOptions
+        _supabase = create_client(
+            settings.SUPABASE_URL,
+            settings.SUPABASE_SERVICE_KEY,
+            options=ClientOptions(postgrest_client_timeout=settings.BACKEND_TIMEOUT_SECONDS)
+        )
+        logger.info("Supabase client created")
+    return _supabase
+
+def get_repository() -> Repository:
+    """Return the configured storage backend, wrapped with timeouts and a circuit breaker"""
+    global _repository
+    if _repository is None:
+        if settings.DATABASE_BACKEND == "sql":
+            from app.repositories.sql_repository import SQLRepository
+            backend = SQLRepository(
+                settings.DATABASE_URL,
+                pool_size=settings.DB_POOL_SIZE,
+                max_overflow=settings.DB_MAX_OVERFLOW
+            )
+        else:
+            from app.repositories.supabase_repository import SupabaseRepository
+            backend = SupabaseRepository(get_supabase())
+        _repository = ResilientRepository(
+            backend,
+            timeout=settings.BACKEND_TIMEOUT_SECONDS,
+            read_retries=settings.BACKEND_READ_RETRIES,
+            retry_backoff=settings.BACKEND_RETRY_BACKOFF_SECONDS,
+            breaker=CircuitBreaker(settings.BREAKER_FAILURE_THRESHOLD, settings.BREAKER_RESET_SECONDS)
+        )
+    return _repository
+
+async def connect_database() -> Repository:
+    """Build the backend (if needed) and open its connections once"""
+    global _connected
+    repo = get_repository()
+    if not _connected:
+        await repo.connect()
+        _connected = True
+    return repo
+
+async def init_database() -> bool:
+    """Connect with retries and backoff; returns False if the backend stayed unavailable"""
+    attempts = settings.DB_CONNECT_RETRIES
+    for attempt in range(1, attempts + 1):
+        try:
+            await connect_database()
+            logger.info("Database backend ready")
+            return True
+        except Exception as e:
+            logger.error(f"Database connect attempt {attempt}/{attempts} failed: {e}")
+            if attempt < attempts:
+                await asyncio.sleep(settings.DB_CONNECT_BACKOFF_SECONDS * 2 ** (attempt - 1))
+    return False
+
+def backend_stats() -> Optional[dict]:
+    return _repository.stats() if _repository is not None else None
 
-def get_supabase() -> Client:
-    return supabase
+async def close_database() -> None:
+    global _repository, _connected
+    if _repository is not None:
+        await _repository.close()
+    _repository = None
+    _connected = False
@@ -1,16 +1,43 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
+from app.database import init_database, close_database, backend_stats, get_repository
+from app.middleware import (
+    CompressionMiddleware, ContentNegotiationMiddleware, NegotiatedResponse, StaleResponseMiddleware
+)
+from app.routes.analytics_routes import analytics_router
 from app.routes.auth_routes import auth_router
+from app.routes.health_routes import health_router
 from app.routes.issue_routes import issue_router
 from app.routes.user_routes import user_router
+from app.services.analytics_service import sla_rollups
+from app.services.issue_service import issue_reads, stale_reads
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # A backend that is still down after the retries leaves the worker up but
+    # not ready; /health/ready keeps retrying lazily.
+    await init_database()
+    # Replay the status event log off the request path; requests then only fold new events
+    sla_warm_up = asyncio.create_task(sla_rollups.warm(get_repository, settings.SLA_WARMUP_RETRY_SECONDS))
+    yield
+    sla_warm_up.cancel()
+    await close_database()
 
 app = FastAPI(
     title=settings.API_TITLE,
     version=settings.API_VERSION,
-    description="Civic Issue Reporter MVP with JWT Authentication"
+    description="Civic Issue Reporter MVP with JWT Authentication",
+    lifespan=lifespan,
+    default_response_class=NegotiatedResponse
 )
 
+app.add_middleware(StaleResponseMiddleware)
+app.add_middleware(ContentNegotiationMiddleware)
+app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MIN_BYTES)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.ALLOWED_ORIGINS,
@@ -19,10 +46,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Outermost, so profiles include compression and the other middleware
+if settings.PROFILING_ENABLED:
+    from app.middleware.profiling import ProfilingMiddleware
+    from app.routes.profiling_routes import profiling_router
+    app.add_middleware(ProfilingMiddleware)
+    app.include_router(profiling_router)
+
 # Include routers
 app.include_router(auth_router, prefix="/api/v1")
 app.include_router(issue_router, prefix="/api/v1")
 app.include_router(user_router, prefix="/api/v1")
+app.include_router(analytics_router, prefix="/api/v1")
+app.include_router(health_router)
 
 @app.get("/")
 def root():
@@ -32,9 +68,13 @@ def root():
         "docs": "/docs"
     }
 
-@app.get("/health")
-def health():
-    return {"status": "healthy"}
+@app.get("/metrics")
+def metrics():
+    return {
+        "read_coalescing": issue_reads.stats(),
+        "stale_reads": stale_reads.stats(),
+        "backend": backend_stats()
+    }
 
 if __name__ == "__main__":
     import uvicorn
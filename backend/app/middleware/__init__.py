@@ -0,0 +1,15 @@
+"""
+ASGI middleware and response classes shared by all routes
+"""
+
+from .compression import CompressionMiddleware
+from .negotiation import ContentNegotiationMiddleware, NegotiatedResponse
+from .staleness import StaleResponseMiddleware, mark_stale
+
+__all__ = [
+    "CompressionMiddleware",
+    "ContentNegotiationMiddleware",
+    "NegotiatedResponse",
+    "StaleResponseMiddleware",
+    "mark_stale"
+]
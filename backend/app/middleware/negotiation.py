@@ -0,0 +1,88 @@
+from contextvars import ContextVar
+from typing import Any, Dict, Mapping, Optional
+import msgpack
+from starlette.background import BackgroundTask
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+
+# Set per request by ContentNegotiationMiddleware, read when the response renders
+_wants_msgpack: ContextVar[bool] = ContextVar("wants_msgpack", default=False)
+
+
+def parse_accept(accept: str) -> Dict[str, float]:
+    """Media range -> q-value; ranges with a malformed q are dropped"""
+    ranges: Dict[str, float] = {}
+    for part in accept.lower().split(","):
+        media_range, *params = [piece.strip() for piece in part.split(";")]
+        if not media_range:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = -1.0
+        if quality >= 0:
+            ranges[media_range] = max(quality, ranges.get(media_range, 0.0))
+    return ranges
+
+
+def prefers_msgpack(accept: str) -> bool:
+    """MessagePack only when asked for by name and ranked at least as high as JSON"""
+    ranges = parse_accept(accept)
+    msgpack_q = max((ranges.get(media_type, 0.0) for media_type in MSGPACK_MEDIA_TYPES), default=0.0)
+    json_q = next(
+        (ranges[media_range] for media_range in ("application/json", "application/*", "*/*") if media_range in ranges),
+        0.0
+    )
+    return msgpack_q > 0 and msgpack_q >= json_q
+
+
+class ContentNegotiationMiddleware:
+    """Remember whether the client asked for MessagePack in ``Accept``"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = _wants_msgpack.set(prefers_msgpack(Headers(scope=scope).get("accept", "")))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _wants_msgpack.reset(token)
+
+
+class NegotiatedResponse(JSONResponse):
+    """JSON by default, MessagePack when the request's Accept asks for it.
+
+    Used as the app's default response class, so route return values are
+    encoded once in the negotiated format.
+    """
+
+    # Explicit signature: FastAPI reads the default status_code off it for OpenAPI
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None,
+        background: Optional[BackgroundTask] = None
+    ):
+        if media_type is None and _wants_msgpack.get():
+            media_type = MSGPACK_MEDIA_TYPES[0]
+        super().__init__(content, status_code, headers, media_type, background)
+        self.headers.add_vary_header("Accept")
+
+    def render(self, content: Any) -> bytes:
+        if self.media_type == MSGPACK_MEDIA_TYPES[0]:
+            return msgpack.packb(content, use_bin_type=True)
+        return super().render(content)
@@ -0,0 +1,171 @@
+import hmac
+import json
+import os
+import random
+import time
+import uuid
+from typing import Dict, Optional
+from pyinstrument import Profiler
+from pyinstrument.renderers import SpeedscopeRenderer
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.auth.jwt_handler import verify_token
+from app.config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "x-profile"
+TOKEN_HEADER = "x-profile-token"
+
+# Time is charged to the innermost frame matching one of these (checked in order)
+BREAKDOWN_RULES = (
+    ("backend_io", ("/app/repositories/", "/supabase/", "/postgrest/", "/httpx/", "/sqlalchemy/")),
+    ("validation", ("/pydantic/", "/pydantic_core/")),
+    ("serialization", ("/fastapi/encoders.py", "/app/middleware/negotiation.py", "/json/", "/msgpack/")),
+)
+
+
+def can_profile(headers: Headers) -> bool:
+    """Profiling admin token, or a bearer token for an employee"""
+    token = headers.get(TOKEN_HEADER)
+    if token and settings.PROFILING_ADMIN_TOKEN:
+        return hmac.compare_digest(token, settings.PROFILING_ADMIN_TOKEN)
+
+    scheme, _, credentials = headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not credentials:
+        return False
+    try:
+        return verify_token(credentials).get("role") == "employee"
+    except Exception:
+        return False
+
+
+def _classify(file_path: Optional[str]) -> Optional[str]:
+    if not file_path:
+        return None
+    path = file_path.replace("\\", "/")
+    for category, markers in BREAKDOWN_RULES:
+        if any(marker in path for marker in markers):
+            return category
+    return None
+
+
+def time_breakdown(root) -> Dict[str, float]:
+    """Split profiled wall time (ms) into backend I/O, validation, serialization and other"""
+    totals = {category: 0.0 for category, _ in BREAKDOWN_RULES}
+    totals["other"] = 0.0
+
+    def walk(frame, inherited: str) -> None:
+        category = _classify(frame.file_path) or inherited
+        own_time = frame.time - sum(child.time for child in frame.children)
+        totals[category] += own_time
+        for child in frame.children:
+            walk(child, category)
+
+    if root is not None:
+        walk(root, "other")
+    return {category: round(seconds * 1000, 2) for category, seconds in totals.items()}
+
+
+def list_profiles() -> list:
+    """Metadata of stored profiles, newest first"""
+    directory = settings.PROFILING_OUTPUT_DIR
+    if not os.path.isdir(directory):
+        return []
+    profiles = []
+    for name in os.listdir(directory):
+        if name.endswith(".meta.json"):
+            with open(os.path.join(directory, name)) as f:
+                profiles.append(json.load(f))
+    return sorted(profiles, key=lambda p: p["started_at"], reverse=True)
+
+
+def profile_path(profile_id: str) -> str:
+    return os.path.join(settings.PROFILING_OUTPUT_DIR, f"{profile_id}.speedscope.json")
+
+
+def _save_profile(profiler: Profiler, meta: dict) -> None:
+    directory = settings.PROFILING_OUTPUT_DIR
+    os.makedirs(directory, exist_ok=True)
+
+    session = profiler.last_session
+    meta["breakdown_ms"] = time_breakdown(session.root_frame() if session else None)
+    with open(profile_path(meta["id"]), "w") as f:
+        f.write(profiler.output(SpeedscopeRenderer()))
+    with open(os.path.join(directory, f"{meta['id']}.meta.json"), "w") as f:
+        json.dump(meta, f)
+
+    # Keep only the newest PROFILING_MAX_STORED profiles
+    for old in list_profiles()[settings.PROFILING_MAX_STORED:]:
+        for suffix in (".speedscope.json", ".meta.json"):
+            try:
+                os.remove(os.path.join(directory, old["id"] + suffix))
+            except OSError:
+                pass
+
+
+class ProfilingMiddleware:
+    """Statistical profile of selected requests, saved as speedscope JSON.
+
+    A request is profiled when it sends ``X-Profile: 1`` with an employee
+    bearer token or ``X-Profile-Token`` matching PROFILING_ADMIN_TOKEN, or
+    when picked at PROFILING_SAMPLE_RATE. Only one request per worker is
+    profiled at a time. The response carries ``X-Profile-Id``; download the
+    profile from /profiling/profiles/{id}.
+
+    Only installed when PROFILING_ENABLED is set, so there is no cost otherwise.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.active = False
+
+    def _trigger(self, scope: Scope) -> Optional[str]:
+        headers = Headers(scope=scope)
+        if headers.get(PROFILE_HEADER) and can_profile(headers):
+            return "header"
+        if settings.PROFILING_SAMPLE_RATE > 0 and random.random() < settings.PROFILING_SAMPLE_RATE:
+            return "sample"
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self.active:
+            await self.app(scope, receive, send)
+            return
+
+        trigger = self._trigger(scope)
+        if trigger is None:
+            await self.app(scope, receive, send)
+            return
+
+        meta = {
+            "id": uuid.uuid4().hex[:12],
+            "method": scope["method"],
+            "path": scope["path"],
+            "trigger": trigger,
+            "started_at": time.time(),
+            "status": None
+        }
+
+        async def send_with_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                meta["status"] = message["status"]
+                MutableHeaders(raw=message["headers"])["X-Profile-Id"] = meta["id"]
+            await send(message)
+
+        self.active = True
+        profiler = Profiler(interval=settings.PROFILING_INTERVAL_SECONDS, async_mode="enabled")
+        started = time.perf_counter()
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            profiler.stop()
+            self.active = False
+            meta["duration_ms"] = round((time.perf_counter() - started) * 1000, 2)
+            try:
+                await run_in_threadpool(_save_profile, profiler, meta)
+            except Exception as e:
+                logger.error(f"Saving profile {meta['id']} failed: {e}")
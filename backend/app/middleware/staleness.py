@@ -0,0 +1,41 @@
+from contextvars import ContextVar
+from typing import Optional
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Per-request flags; a dict so code running in a copied context can still set them
+_request_flags: ContextVar[Optional[dict]] = ContextVar("request_flags", default=None)
+
+
+def mark_stale() -> None:
+    """Flag the current response as served from cache while the backend is down"""
+    flags = _request_flags.get()
+    if flags is not None:
+        flags["stale"] = True
+
+
+class StaleResponseMiddleware:
+    """Adds ``Warning: 110`` and ``X-Data-Stale`` headers to responses flagged by mark_stale()"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        flags: dict = {}
+        token = _request_flags.set(flags)
+
+        async def send_with_flags(message: Message) -> None:
+            if message["type"] == "http.response.start" and flags.get("stale"):
+                headers = MutableHeaders(raw=message["headers"])
+                headers["Warning"] = '110 - "Response is Stale"'
+                headers["X-Data-Stale"] = "true"
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_flags)
+        finally:
+            _request_flags.reset(token)
@@ -1,4 +1,6 @@
 from pydantic import BaseModel, Field, validator
+from typing import Optional
+from app.models.issue_models import DEPARTMENTS, canonical_department
 import re
 
 class SignupRequest(BaseModel):
@@ -6,7 +8,7 @@ class SignupRequest(BaseModel):
     phone_number: str = Field(..., example="+911234567890")
     password: str = Field(..., min_length=4)
     role: str = Field(default="citizen", example="citizen")
-    department: str = Field(None, example="Public Works")
+    department: Optional[str] = Field(None, example="Public Works")
     
     @validator('phone_number')
     def validate_phone(cls, v):
@@ -19,6 +21,16 @@ class SignupRequest(BaseModel):
         if v not in ['citizen', 'employee']:
             raise ValueError('Role must be citizen or employee')
         return v
+    
+    @validator('department', always=True)
+    def validate_department(cls, v, values):
+        # Employees are matched to issue queues by department, so it must be a known one
+        if v is None and values.get('role') != 'employee':
+            return v
+        department = canonical_department(v)
+        if department is None:
+            raise ValueError(f"Department must be one of: {', '.join(DEPARTMENTS)}")
+        return department
 
 class LoginRequest(BaseModel):
     phone_number: str = Field(..., example="+911234567890")
@@ -1,6 +1,6 @@
 
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 from enum import Enum
 
@@ -11,6 +11,9 @@ class IssueStatus(str, Enum):
     RESOLVED = "resolved"
     REJECTED = "rejected"
 
+# Statuses that still need work (queued or assigned)
+OPEN_STATUSES = (IssueStatus.NEW.value, IssueStatus.ACKNOWLEDGED.value, IssueStatus.IN_PROGRESS.value)
+
 class IssueCategory(str, Enum):
     ROADS = "roads"
     STREETLIGHTS = "streetlights"
@@ -22,6 +25,26 @@ class IssueCategory(str, Enum):
     ELECTRICITY = "electricity"
     OTHER = "other"
 
+# Department that works each category; employees pick one of these at signup
+CATEGORY_DEPARTMENTS = {
+    "roads": "Public Works",
+    "drainage": "Public Works",
+    "streetlights": "Electricity",
+    "electricity": "Electricity",
+    "water_supply": "Water Supply",
+    "waste_management": "Sanitation",
+    "public_transport": "Transport",
+    "parks": "Parks",
+    "other": "General",
+}
+
+DEPARTMENTS = tuple(sorted(set(CATEGORY_DEPARTMENTS.values())))
+
+def canonical_department(department: Optional[str]) -> Optional[str]:
+    """The department's canonical name, matched ignoring case and surrounding spaces"""
+    wanted = (department or "").strip().lower()
+    return next((name for name in DEPARTMENTS if name.lower() == wanted), None)
+
 class IssuePriority(str, Enum):
     LOW = "low"
     MEDIUM = "medium"
@@ -44,7 +67,7 @@ class IssueUpdate(BaseModel):
     resolution_notes: Optional[str] = None
     assigned_to: Optional[str] = None
 
-class IssueResponse(BaseModel):
+class IssueRecord(BaseModel):
     id: str
     user_id: str
     title: str
@@ -61,12 +84,22 @@ class IssueResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     
+    class Config:
+        from_attributes = True
+
+class IssueResponse(IssueRecord):
     # User info (from join)
     reporter_name: Optional[str] = None
     reporter_phone: Optional[str] = None
-    
-    class Config:
-        from_attributes = True
+
+class ReporterInfo(BaseModel):
+    name: Optional[str] = None
+    phone: Optional[str] = None
+
+class NormalizedIssueList(BaseModel):
+    """Issue list with each reporter sent once, referenced by user_id"""
+    reporters: Dict[str, ReporterInfo]
+    issues: List[IssueRecord]
 
 class VoteCreate(BaseModel):
     vote_type: str = Field(default="upvote", pattern="^(upvote|downvote)$")
@@ -0,0 +1,9 @@
+"""
+Storage backends behind the service layer (Supabase REST or plain SQL)
+"""
+
+from .base import Repository
+
+__all__ = [
+    "Repository"
+]
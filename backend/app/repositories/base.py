@@ -0,0 +1,121 @@
+from abc import ABC, abstractmethod
+from typing import List, Dict, Any, Optional, Tuple, Type
+
+
+class OpenLimitReached(Exception):
+    """The employee already holds the maximum number of open issues"""
+
+
+class Repository(ABC):
+    """Storage interface used by the services.
+
+    Rows are plain dicts shaped like the Supabase tables. Issue rows carry
+    ``reporter_name``/``reporter_phone`` and comment rows ``commenter_name``
+    already resolved from ``user_profiles``.
+    """
+
+    # Errors that mean the backend is unreachable or overloaded (retryable)
+    transient_errors: Tuple[Type[BaseException], ...] = (OSError,)
+
+    def is_transient(self, error: BaseException) -> bool:
+        """Whether ``error`` means the backend is unavailable rather than the request bad"""
+        return isinstance(error, self.transient_errors)
+
+    async def connect(self) -> None:
+        """Open connections / create schema (optional)"""
+
+    async def close(self) -> None:
+        """Release connections (optional)"""
+
+    @abstractmethod
+    async def ping(self) -> None:
+        """Cheap round trip to the backend; raises if it is unreachable"""
+
+    # Users
+    @abstractmethod
+    async def get_user_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    async def get_user_by_phone(self, phone_number: str) -> Optional[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    async def create_user(self, user_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        ...
+
+    # Issues
+    @abstractmethod
+    async def create_issue(self, issue_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    async def list_issues(
+        self,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        priority: Optional[str] = None,
+        user_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Issues joined with reporter info, newest first"""
+
+    @abstractmethod
+    async def get_issue(self, issue_id: str) -> Optional[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    async def update_issue(self, issue_id: str, update_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    async def list_open_issues(self) -> List[Dict[str, Any]]:
+        """Issues in OPEN_STATUSES with an ``upvotes`` count"""
+
+    @abstractmethod
+    async def claim_issue(
+        self, issue_id: str, employee_id: str, current_status: str, max_open: int
+    ) -> Optional[Dict[str, Any]]:
+        """Assign an unassigned issue still in ``current_status``, acknowledging it if new;
+        None if it was already taken or its status moved on.
+
+        Raises OpenLimitReached if the employee already has ``max_open`` open
+        issues; the count and the assignment are atomic per employee.
+        """
+
+    @abstractmethod
+    async def list_issue_locations(
+        self, after: Optional[Tuple[Any, str]] = None, limit: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """One page of ``id``, ``category``, ``location_lat``, ``location_lng`` and ``created_at``,
+        ordered by ``(created_at, id)`` and starting after the ``after`` key"""
+
+    # Status history
+    @abstractmethod
+    async def record_status_event(self, event_data: Dict[str, Any]) -> None:
+        """Append a status transition to ``issue_status_events``"""
+
+    @abstractmethod
+    async def list_status_events(self, after_id: int = 0, limit: int = 1000) -> List[Dict[str, Any]]:
+        """Status transitions with ``id > after_id``, oldest first"""
+
+    # Votes
+    @abstractmethod
+    async def get_vote(self, issue_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    async def create_vote(self, vote_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    async def count_user_votes(self, user_id: str) -> int:
+        ...
+
+    # Comments
+    @abstractmethod
+    async def create_comment(self, comment_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    async def list_comments(self, issue_id: str) -> List[Dict[str, Any]]:
+        """Comments joined with commenter name, newest first"""
@@ -0,0 +1,237 @@
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from fastapi import HTTPException, status
+from .base import Repository
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class BackendUnavailable(HTTPException):
+    """The backend timed out, kept failing, or the circuit breaker is open (503)"""
+
+    def __init__(self, detail: str = "Service temporarily unavailable", retry_after: Optional[float] = None):
+        headers = {"Retry-After": str(max(1, int(retry_after)))} if retry_after else None
+        super().__init__(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=detail, headers=headers)
+
+
+class CircuitBreaker:
+    """Opens after ``failure_threshold`` consecutive failures.
+
+    While open every call fails fast. After ``reset_timeout`` seconds one
+    trial call is let through (half-open); its outcome closes or re-opens
+    the breaker.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_in_flight = False
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def retry_after(self) -> float:
+        if self.opened_at is None:
+            return 0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+    def before_call(self) -> None:
+        state = self.state
+        if state == "closed":
+            return
+        if state == "half_open" and not self.trial_in_flight:
+            self.trial_in_flight = True
+            return
+        self.rejected += 1
+        raise BackendUnavailable("Backend unavailable, failing fast", retry_after=self.retry_after())
+
+    def record_success(self) -> None:
+        if self.opened_at is not None:
+            logger.info("Circuit breaker closed")
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self.trial_in_flight = False
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            if self.opened_at is None:
+                logger.error(f"Circuit breaker opened after {self.failures} failures")
+            self.opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "rejected_calls": self.rejected,
+            "retry_after_seconds": round(self.retry_after(), 1)
+        }
+
+
+class ResilientRepository(Repository):
+    """Wraps a repository with per-call timeouts, a circuit breaker, and
+    bounded retries with full jitter for idempotent reads.
+
+    Only errors the inner repository reports via ``is_transient`` (and timeouts) count as
+    backend failures; those surface as BackendUnavailable. Other errors pass
+    through untouched and don't trip the breaker.
+    """
+
+    def __init__(
+        self,
+        inner: Repository,
+        timeout: float,
+        read_retries: int,
+        retry_backoff: float,
+        breaker: CircuitBreaker
+    ):
+        self.inner = inner
+        self.timeout = timeout
+        self.read_retries = read_retries
+        self.retry_backoff = retry_backoff
+        self.breaker = breaker
+        self.transient_errors = inner.transient_errors
+
+    def is_transient(self, error: BaseException) -> bool:
+        return isinstance(error, asyncio.TimeoutError) or self.inner.is_transient(error)
+
+    async def _call(self, name: str, fn: Callable[[], Awaitable[Any]], retries: int) -> Any:
+        for attempt in range(retries + 1):
+            self.breaker.before_call()
+            try:
+                result = await asyncio.wait_for(fn(), self.timeout)
+            except asyncio.CancelledError:
+                self.breaker.trial_in_flight = False
+                raise
+            except Exception as e:
+                if not self.is_transient(e):
+                    # The backend answered, so it is healthy even if the call failed
+                    self.breaker.record_success()
+                    raise
+                self.breaker.record_failure()
+                logger.error(f"Backend {name} failed (attempt {attempt + 1}/{retries + 1}): {e!r}")
+                if attempt == retries:
+                    raise BackendUnavailable() from e
+                await asyncio.sleep(random.uniform(0, self.retry_backoff * 2 ** attempt))
+            else:
+                self.breaker.record_success()
+                return result
+
+    async def _scan(self, name: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Like _read, but outside the breaker: pages of a bulk background load
+        must not fail fast every other endpoint when they time out.
+        """
+        if self.breaker.state == "open":
+            raise BackendUnavailable("Backend unavailable, failing fast", retry_after=self.breaker.retry_after())
+        for attempt in range(self.read_retries + 1):
+            try:
+                return await asyncio.wait_for(fn(), self.timeout)
+            except Exception as e:
+                if not self.is_transient(e):
+                    raise
+                logger.error(f"Backend {name} failed (attempt {attempt + 1}/{self.read_retries + 1}): {e!r}")
+                if attempt == self.read_retries:
+                    raise BackendUnavailable() from e
+                await asyncio.sleep(random.uniform(0, self.retry_backoff * 2 ** attempt))
+
+    def _read(self, name: str, fn: Callable[[], Awaitable[Any]]) -> Awaitable[Any]:
+        return self._call(name, fn, self.read_retries)
+
+    def _write(self, name: str, fn: Callable[[], Awaitable[Any]]) -> Awaitable[Any]:
+        # Writes are not retried: a timed-out insert may still have landed
+        return self._call(name, fn, 0)
+
+    async def connect(self) -> None:
+        await self.inner.connect()
+
+    async def close(self) -> None:
+        await self.inner.close()
+
+    async def ping(self) -> None:
+        await self._call("ping", self.inner.ping, 0)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"circuit_breaker": self.breaker.stats()}
+
+    # Users
+    async def get_user_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
+        return await self._read("get_user_by_id", lambda: self.inner.get_user_by_id(user_id))
+
+    async def get_user_by_phone(self, phone_number: str) -> Optional[Dict[str, Any]]:
+        return await self._read("get_user_by_phone", lambda: self.inner.get_user_by_phone(phone_number))
+
+    async def create_user(self, user_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        return await self._write("create_user", lambda: self.inner.create_user(user_data))
+
+    # Issues
+    async def create_issue(self, issue_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        return await self._write("create_issue", lambda: self.inner.create_issue(issue_data))
+
+    async def list_issues(
+        self,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        priority: Optional[str] = None,
+        user_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        return await self._read(
+            "list_issues",
+            lambda: self.inner.list_issues(category=category, status=status, priority=priority, user_id=user_id)
+        )
+
+    async def get_issue(self, issue_id: str) -> Optional[Dict[str, Any]]:
+        return await self._read("get_issue", lambda: self.inner.get_issue(issue_id))
+
+    async def update_issue(self, issue_id: str, update_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        return await self._write("update_issue", lambda: self.inner.update_issue(issue_id, update_data))
+
+    async def list_open_issues(self) -> List[Dict[str, Any]]:
+        return await self._read("list_open_issues", self.inner.list_open_issues)
+
+    async def claim_issue(
+        self, issue_id: str, employee_id: str, current_status: str, max_open: int
+    ) -> Optional[Dict[str, Any]]:
+        return await self._write(
+            "claim_issue", lambda: self.inner.claim_issue(issue_id, employee_id, current_status, max_open)
+        )
+
+    async def list_issue_locations(
+        self, after: Optional[Tuple[Any, str]] = None, limit: int = 1000
+    ) -> List[Dict[str, Any]]:
+        return await self._scan("list_issue_locations", lambda: self.inner.list_issue_locations(after, limit))
+
+    # Status history
+    async def record_status_event(self, event_data: Dict[str, Any]) -> None:
+        return await self._write("record_status_event", lambda: self.inner.record_status_event(event_data))
+
+    async def list_status_events(self, after_id: int = 0, limit: int = 1000) -> List[Dict[str, Any]]:
+        return await self._read("list_status_events", lambda: self.inner.list_status_events(after_id, limit))
+
+    # Votes
+    async def get_vote(self, issue_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+        return await self._read("get_vote", lambda: self.inner.get_vote(issue_id, user_id))
+
+    async def create_vote(self, vote_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        return await self._write("create_vote", lambda: self.inner.create_vote(vote_data))
+
+    async def count_user_votes(self, user_id: str) -> int:
+        return await self._read("count_user_votes", lambda: self.inner.count_user_votes(user_id))
+
+    # Comments
+    async def create_comment(self, comment_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        return await self._write("create_comment", lambda: self.inner.create_comment(comment_data))
+
+    async def list_comments(self, issue_id: str) -> List[Dict[str, Any]]:
+        return await self._read("list_comments", lambda: self.inner.list_comments(issue_id))
@@ -0,0 +1,213 @@
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
+import httpx
+from postgrest.exceptions import APIError
+from starlette.concurrency import run_in_threadpool
+from supabase import Client
+from app.models.issue_models import OPEN_STATUSES
+from .base import OpenLimitReached, Repository
+
+ISSUE_SELECT = "*, user_profiles!inner(full_name, phone_number)"
+COMMENT_SELECT = "*, user_profiles!inner(full_name)"
+
+# SQLSTATE classes for lost connections (08), resource exhaustion (53) and
+# cancelled / shutting-down servers (57, incl. 57014 statement timeout)
+TRANSIENT_SQLSTATE_CLASSES = ("08", "53", "57")
+# PostgREST's own "could not reach the database" errors
+TRANSIENT_POSTGREST_CODES = {"PGRST000", "PGRST001", "PGRST002", "PGRST003"}
+# Raised by the claim_issue() database function (supabase/migrations)
+OPEN_LIMIT_REACHED_CODE = "UE001"
+
+
+def _flatten_issue(item: Dict[str, Any]) -> Dict[str, Any]:
+    issue_dict = {**item}
+    profile = issue_dict.pop("user_profiles", None) or {}
+    issue_dict["reporter_name"] = profile.get("full_name")
+    issue_dict["reporter_phone"] = profile.get("phone_number")
+    return issue_dict
+
+
+def _flatten_comment(item: Dict[str, Any]) -> Dict[str, Any]:
+    comment_dict = {**item}
+    profile = comment_dict.pop("user_profiles", None) or {}
+    comment_dict["commenter_name"] = profile.get("full_name")
+    return comment_dict
+
+
+class SupabaseRepository(Repository):
+    """Repository backed by the Supabase REST client.
+
+    The client is synchronous, so every query runs in the threadpool instead
+    of blocking the event loop.
+    """
+
+    transient_errors = (OSError, httpx.TransportError)
+
+    def __init__(self, client: Client):
+        self.client = client
+
+    def is_transient(self, error: BaseException) -> bool:
+        if isinstance(error, APIError):
+            # Non-JSON bodies (e.g. a gateway 502/503/504) carry the HTTP status as code
+            code = str(error.code or "")
+            if code.isdigit() and len(code) == 3:
+                return code.startswith("5")
+            return code in TRANSIENT_POSTGREST_CODES or code[:2] in TRANSIENT_SQLSTATE_CLASSES
+        return super().is_transient(error)
+
+    async def _execute(self, query):
+        return await run_in_threadpool(query.execute)
+
+    async def ping(self) -> None:
+        await self._execute(self.client.table("user_profiles").select("id").limit(1))
+
+    # Users
+    async def get_user_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
+        response = await self._execute(self.client.table("user_profiles").select("*").eq("id", user_id))
+        return response.data[0] if response.data else None
+
+    async def get_user_by_phone(self, phone_number: str) -> Optional[Dict[str, Any]]:
+        response = await self._execute(self.client.table("user_profiles").select("*").eq("phone_number", phone_number))
+        return response.data[0] if response.data else None
+
+    async def create_user(self, user_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        response = await self._execute(self.client.table("user_profiles").insert(user_data))
+        return response.data[0] if response.data else None
+
+    # Issues
+    async def create_issue(self, issue_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        response = await self._execute(self.client.table("issues").insert(issue_data))
+        if not response.data:
+            return None
+
+        created_issue = response.data[0]
+        user = await self.get_user_by_id(issue_data["user_id"])
+        if user:
+            created_issue["reporter_name"] = user["full_name"]
+            created_issue["reporter_phone"] = user["phone_number"]
+        return created_issue
+
+    async def list_issues(
+        self,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        priority: Optional[str] = None,
+        user_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        query = self.client.table("issues").select(ISSUE_SELECT)
+
+        if category:
+            query = query.eq("category", category)
+        if status:
+            query = query.eq("status", status)
+        if priority:
+            query = query.eq("priority", priority)
+        if user_id:
+            query = query.eq("user_id", user_id)
+
+        response = await self._execute(query.order("created_at", desc=True))
+        return [_flatten_issue(item) for item in response.data]
+
+    async def get_issue(self, issue_id: str) -> Optional[Dict[str, Any]]:
+        response = await self._execute(self.client.table("issues").select(ISSUE_SELECT).eq("id", issue_id))
+        return _flatten_issue(response.data[0]) if response.data else None
+
+    async def update_issue(self, issue_id: str, update_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        response = await self._execute(self.client.table("issues").update(update_data).eq("id", issue_id))
+        return response.data[0] if response.data else None
+
+    async def list_open_issues(self) -> List[Dict[str, Any]]:
+        response = await self._execute(
+            self.client.table("issues").select("*, votes(vote_type)").in_("status", list(OPEN_STATUSES))
+        )
+        issues = []
+        for item in response.data:
+            issue_dict = {**item}
+            votes = issue_dict.pop("votes", None) or []
+            issue_dict["upvotes"] = sum(1 for v in votes if v.get("vote_type") == "upvote")
+            issues.append(issue_dict)
+        return issues
+
+    async def claim_issue(
+        self, issue_id: str, employee_id: str, current_status: str, max_open: int
+    ) -> Optional[Dict[str, Any]]:
+        # The open-issue count and the compare-and-set update must share a transaction,
+        # which PostgREST only offers through a database function
+        try:
+            response = await self._execute(self.client.rpc("claim_issue", {
+                "p_issue_id": issue_id,
+                "p_employee_id": employee_id,
+                "p_current_status": current_status,
+                "p_max_open": max_open
+            }))
+        except APIError as e:
+            if e.code == OPEN_LIMIT_REACHED_CODE:
+                raise OpenLimitReached() from e
+            raise
+        return response.data[0] if response.data else None
+
+    async def list_issue_locations(
+        self, after: Optional[Tuple[Any, str]] = None, limit: int = 1000
+    ) -> List[Dict[str, Any]]:
+        query = (
+            self.client.table("issues")
+            .select("id, category, location_lat, location_lng, created_at")
+            .order("created_at,id")
+            .limit(limit)
+        )
+        if after is not None:
+            created_at, issue_id = after
+            if isinstance(created_at, datetime):
+                created_at = created_at.isoformat()
+            # Keyset condition; timestamps are quoted since they contain reserved characters
+            query.params = query.params.add(
+                "or", f'(created_at.gt."{created_at}",and(created_at.eq."{created_at}",id.gt.{issue_id}))'
+            )
+        response = await self._execute(query)
+        return response.data
+
+    # Status history
+    async def record_status_event(self, event_data: Dict[str, Any]) -> None:
+        row = {k: v.isoformat() if isinstance(v, datetime) else v for k, v in event_data.items()}
+        await self._execute(self.client.table("issue_status_events").insert(row))
+
+    async def list_status_events(self, after_id: int = 0, limit: int = 1000) -> List[Dict[str, Any]]:
+        response = await self._execute(
+            self.client.table("issue_status_events").select("*").gt("id", after_id).order("id").limit(limit)
+        )
+        return response.data
+
+    # Votes
+    async def get_vote(self, issue_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+        response = await self._execute(
+            self.client.table("votes").select("*").eq("user_id", user_id).eq("issue_id", issue_id)
+        )
+        return response.data[0] if response.data else None
+
+    async def create_vote(self, vote_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        response = await self._execute(self.client.table("votes").insert(vote_data))
+        return response.data[0] if response.data else None
+
+    async def count_user_votes(self, user_id: str) -> int:
+        response = await self._execute(
+            self.client.table("votes").select("id", count="exact").eq("user_id", user_id)
+        )
+        return response.count if response.count is not None else len(response.data)
+
+    # Comments
+    async def create_comment(self, comment_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        response = await self._execute(self.client.table("comments").insert(comment_data))
+        if not response.data:
+            return None
+
+        comment = response.data[0]
+        user = await self.get_user_by_id(comment_data["user_id"])
+        if user:
+            comment["commenter_name"] = user["full_name"]
+        return comment
+
+    async def list_comments(self, issue_id: str) -> List[Dict[str, Any]]:
+        response = await self._execute(
+            self.client.table("comments").select(COMMENT_SELECT).eq("issue_id", issue_id).order("created_at", desc=True)
+        )
+        return [_flatten_comment(item) for item in response.data]
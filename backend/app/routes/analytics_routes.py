@@ -0,0 +1,41 @@
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import Response
+from app.auth.auth_middleware import require_employee
+from app.models.issue_models import IssueCategory
+from app.services.analytics_service import AnalyticsService
+
+# Kept here rather than imported from heatmap_service, which pulls in NumPy
+HEATMAP_MAX_RESOLUTION = 1024
+
+analytics_router = APIRouter(prefix="/analytics", tags=["Analytics"])
+
+@analytics_router.get("/sla")
+async def get_sla_report(
+    start: Optional[datetime] = Query(None, alias="from"),
+    end: Optional[datetime] = Query(None, alias="to"),
+    group_by: Optional[str] = Query("category", description="Comma-separated: category, department, priority"),
+    current_user: dict = Depends(require_employee)
+):
+    """Time-to-acknowledge and time-to-resolve percentiles (employees only)"""
+    return await AnalyticsService.get_sla_report(start, end, group_by)
+
+@analytics_router.get("/heatmap")
+async def get_heatmap(
+    bbox: str = Query(..., description="min_lng,min_lat,max_lng,max_lat"),
+    resolution: int = Query(256, ge=8, le=HEATMAP_MAX_RESOLUTION, description="Grid cells per side"),
+    category: Optional[IssueCategory] = Query(None),
+    since: Optional[datetime] = Query(None),
+    format: str = Query("json", pattern="^(json|png)$"),
+    current_user: dict = Depends(require_employee)
+):
+    """Issue density grid for planners (employees only)"""
+    # Imported on first use so NumPy stays out of worker startup
+    from app.services.heatmap_service import HeatmapService
+
+    body, media_type = await HeatmapService.get_heatmap(
+        bbox, resolution, category.value if category else None, since, format
+    )
+    # Already encoded (and cached as bytes), so skip FastAPI's encoder
+    return Response(content=body, media_type=media_type)
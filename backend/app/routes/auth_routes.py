@@ -7,9 +7,9 @@ auth_router = APIRouter(prefix="/auth", tags=["Authentication"])
 @auth_router.post("/signup", response_model=TokenResponse)
 async def signup(request: SignupRequest):
     """Register new user"""
-    return AuthService.signup(request)
+    return await AuthService.signup(request)
 
 @auth_router.post("/login", response_model=TokenResponse)  
 async def login(request: LoginRequest):
     """Login user"""
-    return AuthService.login(request)
+    return await AuthService.login(request)
@@ -0,0 +1,52 @@
+import asyncio
+import time
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from app.config import settings
+from app.database import connect_database
+import logging
+
+logger = logging.getLogger(__name__)
+
+health_router = APIRouter(prefix="/health", tags=["Health"])
+
+# Last readiness result, reused for READINESS_CACHE_SECONDS so frequent probes
+# don't hammer the backend
+_readiness = {"ready": False, "error": "not checked yet", "checked_at": 0.0}
+_readiness_lock = asyncio.Lock()
+
+async def check_backend() -> dict:
+    """Ping the backend, reusing a recent result"""
+    async with _readiness_lock:
+        if time.monotonic() - _readiness["checked_at"] < settings.READINESS_CACHE_SECONDS:
+            return _readiness
+        
+        try:
+            repo = await asyncio.wait_for(connect_database(), settings.READINESS_TIMEOUT_SECONDS)
+            await asyncio.wait_for(repo.ping(), settings.READINESS_TIMEOUT_SECONDS)
+            _readiness.update(ready=True, error=None)
+        except Exception as e:
+            logger.error(f"Readiness check failed: {e!r}")
+            _readiness.update(ready=False, error=repr(e))
+        _readiness["checked_at"] = time.monotonic()
+        return _readiness
+
+@health_router.get("")
+def health():
+    return {"status": "healthy"}
+
+@health_router.get("/live")
+def liveness():
+    """Process is up and serving the event loop"""
+    return {"status": "alive"}
+
+@health_router.get("/ready")
+async def readiness():
+    """Backend is reachable; 503 tells the orchestrator to hold traffic"""
+    result = await check_backend()
+    body = {
+        "status": "ready" if result["ready"] else "not_ready",
+        "backend": settings.DATABASE_BACKEND,
+        "error": result["error"]
+    }
+    return JSONResponse(status_code=200 if result["ready"] else 503, content=body)
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, Query, Path
-from typing import List, Optional
+from typing import List, Optional, Union
 from app.models.issue_models import (
-    IssueCreate, IssueUpdate, IssueResponse, 
+    IssueCreate, IssueUpdate, IssueResponse, NormalizedIssueList,
     VoteCreate, CommentCreate, CommentResponse
 )
 from app.auth.auth_middleware import get_current_user, require_employee
@@ -15,26 +15,36 @@ async def create_issue(
     current_user: dict = Depends(get_current_user)
 ):
     """Create new issue (authenticated users only)"""
-    return IssueService.create_issue(issue, current_user["user_id"])
+    return await IssueService.create_issue(issue, current_user["user_id"])
 
-@issue_router.get("/", response_model=List[IssueResponse])
+SHAPE_QUERY = Query("full", pattern="^(full|normalized)$", description="normalized sends each reporter once")
+
+@issue_router.get("/", response_model=Union[List[IssueResponse], NormalizedIssueList])
 async def get_all_issues(
     category: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
-    priority: Optional[str] = Query(None)
+    priority: Optional[str] = Query(None),
+    shape: str = SHAPE_QUERY
 ):
     """Get all issues (public endpoint)"""
-    return IssueService.get_all_issues(category, status, priority)
+    issues = await IssueService.get_all_issues(category, status, priority)
+    return IssueService.normalize(issues) if shape == "normalized" else issues
 
-@issue_router.get("/my", response_model=List[IssueResponse])
-async def get_my_issues(current_user: dict = Depends(get_current_user)):
+@issue_router.get("/my", response_model=Union[List[IssueResponse], NormalizedIssueList])
+async def get_my_issues(shape: str = SHAPE_QUERY, current_user: dict = Depends(get_current_user)):
     """Get current user's issues"""
-    return IssueService.get_user_issues(current_user["user_id"])
+    issues = await IssueService.get_user_issues(current_user["user_id"])
+    return IssueService.normalize(issues) if shape == "normalized" else issues
+
+@issue_router.get("/queue/next", response_model=IssueResponse)
+async def claim_next_issue(current_user: dict = Depends(require_employee)):
+    """Claim the next issue from your department's queue (employees only)"""
+    return await IssueService.claim_next_issue(current_user["user_id"])
 
 @issue_router.get("/{issue_id}", response_model=IssueResponse)
 async def get_issue(issue_id: str = Path(...)):
     """Get single issue by ID"""
-    return IssueService.get_issue_by_id(issue_id)
+    return await IssueService.get_issue_by_id(issue_id)
 
 @issue_router.put("/{issue_id}", response_model=IssueResponse)
 async def update_issue(
@@ -43,7 +53,7 @@ async def update_issue(
     current_user: dict = Depends(require_employee)
 ):
     """Update issue (employees only)"""
-    return IssueService.update_issue(issue_id, issue_update)
+    return await IssueService.update_issue(issue_id, issue_update, current_user["user_id"])
 
 @issue_router.post("/{issue_id}/vote")
 async def vote_on_issue(
@@ -52,7 +62,7 @@ async def vote_on_issue(
     current_user: dict = Depends(get_current_user)
 ):
     """Vote on issue"""
-    return IssueService.vote_on_issue(issue_id, current_user["user_id"], vote.vote_type)
+    return await IssueService.vote_on_issue(issue_id, current_user["user_id"], vote.vote_type)
 
 @issue_router.post("/{issue_id}/comments", response_model=CommentResponse)
 async def add_comment(
@@ -61,9 +71,9 @@ async def add_comment(
     current_user: dict = Depends(get_current_user)
 ):
     """Add comment to issue"""
-    return IssueService.add_comment(issue_id, current_user["user_id"], comment)
+    return await IssueService.add_comment(issue_id, current_user["user_id"], comment)
 
 @issue_router.get("/{issue_id}/comments", response_model=List[CommentResponse])
 async def get_issue_comments(issue_id: str):
     """Get comments for issue"""
-    return IssueService.get_issue_comments(issue_id)
+    return await IssueService.get_issue_comments(issue_id)
@@ -0,0 +1,31 @@
+import os
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, status
+from fastapi.responses import FileResponse
+from app.middleware.profiling import can_profile, list_profiles, profile_path
+
+def require_profiler_access(request: Request) -> None:
+    """Employee bearer token or the profiling admin token"""
+    if not can_profile(request.headers):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Employee or profiling admin token required"
+        )
+
+profiling_router = APIRouter(
+    prefix="/profiling",
+    tags=["Profiling"],
+    dependencies=[Depends(require_profiler_access)]
+)
+
+@profiling_router.get("/profiles")
+async def get_profiles():
+    """Recent request profiles with their time breakdown"""
+    return list_profiles()
+
+@profiling_router.get("/profiles/{profile_id}")
+async def download_profile(profile_id: str = Path(..., pattern="^[0-9a-f]{12}$")):
+    """Speedscope JSON (open at https://www.speedscope.app)"""
+    path = profile_path(profile_id)
+    if not os.path.exists(path):
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FileResponse(path, media_type="application/json", filename=f"{profile_id}.speedscope.json")
@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Depends
 from app.auth.auth_middleware import get_current_user, require_employee
-from app.database import get_supabase
+from app.database import get_repository
 from app.models.user_models import UserResponse
+from app.repositories.resilience import BackendUnavailable
+from app.services.issue_service import work_queues, stale_reads
 
 user_router = APIRouter(prefix="/user", tags=["User"])
 
@@ -9,14 +11,13 @@ user_router = APIRouter(prefix="/user", tags=["User"])
 async def get_profile(current_user: dict = Depends(get_current_user)):
     """Get current user's profile"""
     try:
-        supabase = get_supabase()
-        response = supabase.table("user_profiles").select("*").eq("id", current_user["user_id"]).execute()
+        repo = get_repository()
+        user = await repo.get_user_by_id(current_user["user_id"])
         
-        if not response.data:
+        if not user:
             return {"error": "User not found"}
         
-        user = response.data[0]
-        return {
+        profile = {
             "id": user["id"],
             "full_name": user["full_name"],
             "phone_number": user["phone_number"],
@@ -24,6 +25,13 @@ async def get_profile(current_user: dict = Depends(get_current_user)):
             "department": user.get("department"),
             "status": user["status"]
         }
+        stale_reads.put(("profile", current_user["user_id"]), profile)
+        return profile
+    except BackendUnavailable:
+        cached = stale_reads.get_stale(("profile", current_user["user_id"]))
+        if cached is None:
+            raise
+        return cached
     except Exception as e:
         return {"error": str(e)}
 
@@ -31,31 +39,30 @@ async def get_profile(current_user: dict = Depends(get_current_user)):
 async def citizen_dashboard(current_user: dict = Depends(get_current_user)):
     """Citizen dashboard - view issues statistics"""
     try:
-        supabase = get_supabase()
+        repo = get_repository()
         
         # Get all issues stats
-        all_issues = supabase.table("issues").select("*").execute()
-        my_issues = supabase.table("issues").select("*").eq("user_id", current_user["user_id"]).execute()
-        my_votes = supabase.table("votes").select("*").eq("user_id", current_user["user_id"]).execute()
+        all_issues = await repo.list_issues()
+        my_issues = [i for i in all_issues if i.get("user_id") == current_user["user_id"]]
+        my_votes_count = await repo.count_user_votes(current_user["user_id"])
         
         # Calculate stats
-        total_issues = len(all_issues.data)
-        my_issues_count = len(my_issues.data)
-        my_votes_count = len(my_votes.data)
+        total_issues = len(all_issues)
+        my_issues_count = len(my_issues)
         
         # Group by status
         status_count = {}
-        for issue in all_issues.data:
+        for issue in all_issues:
             status = issue.get("status", "unknown")
             status_count[status] = status_count.get(status, 0) + 1
         
         # Group by category
         category_count = {}
-        for issue in all_issues.data:
+        for issue in all_issues:
             category = issue.get("category", "other")
             category_count[category] = category_count.get(category, 0) + 1
         
-        return {
+        dashboard = {
             "role": "citizen",
             "user_id": current_user["user_id"],
             "stats": {
@@ -65,9 +72,16 @@ async def citizen_dashboard(current_user: dict = Depends(get_current_user)):
                 "issues_by_status": status_count,
                 "issues_by_category": category_count
             },
-            "recent_issues": all_issues.data[:5]
+            "recent_issues": all_issues[:5]
         }
+        stale_reads.put(("citizen_dashboard", current_user["user_id"]), dashboard)
+        return dashboard
         
+    except BackendUnavailable:
+        cached = stale_reads.get_stale(("citizen_dashboard", current_user["user_id"]))
+        if cached is None:
+            raise
+        return cached
     except Exception as e:
         return {"error": str(e)}
 
@@ -75,30 +89,33 @@ async def citizen_dashboard(current_user: dict = Depends(get_current_user)):
 async def government_dashboard(current_user: dict = Depends(require_employee)):
     """Government dashboard - manage issues"""
     try:
-        supabase = get_supabase()
+        repo = get_repository()
         
         # Get all issues
-        all_issues = supabase.table("issues").select("*").execute()
+        all_issues = await repo.list_issues()
+        employee = await repo.get_user_by_id(current_user["user_id"])
+        department = employee.get("department") if employee else None
+        await work_queues.ensure_loaded(repo)
         
         # Calculate stats
-        total_issues = len(all_issues.data)
-        new_issues = [i for i in all_issues.data if i.get("status") == "new"]
-        in_progress = [i for i in all_issues.data if i.get("status") == "in_progress"]
-        resolved = [i for i in all_issues.data if i.get("status") == "resolved"]
+        total_issues = len(all_issues)
+        new_issues = [i for i in all_issues if i.get("status") == "new"]
+        in_progress = [i for i in all_issues if i.get("status") == "in_progress"]
+        resolved = [i for i in all_issues if i.get("status") == "resolved"]
         
         # Priority breakdown
         priority_count = {}
-        for issue in all_issues.data:
+        for issue in all_issues:
             priority = issue.get("priority", "medium")
             priority_count[priority] = priority_count.get(priority, 0) + 1
         
         # Category breakdown
         category_count = {}
-        for issue in all_issues.data:
+        for issue in all_issues:
             category = issue.get("category", "other")
             category_count[category] = category_count.get(category, 0) + 1
         
-        return {
+        dashboard = {
             "role": "employee",
             "user_id": current_user["user_id"],
             "stats": {
@@ -107,11 +124,19 @@ async def government_dashboard(current_user: dict = Depends(require_employee)):
                 "in_progress": len(in_progress),
                 "resolved": len(resolved),
                 "by_priority": priority_count,
-                "by_category": category_count
+                "by_category": category_count,
+                "my_open_issues": work_queues.load(current_user["user_id"])
             },
-            "pending_action": new_issues[:10],  # First 10 new issues
-            "high_priority": [i for i in all_issues.data if i.get("priority") == "high"][:5]
+            "pending_action": work_queues.peek(department, 10),  # Top of the department queue
+            "high_priority": [i for i in all_issues if i.get("priority") == "high"][:5]
         }
+        stale_reads.put(("government_dashboard", current_user["user_id"]), dashboard)
+        return dashboard
         
+    except BackendUnavailable:
+        cached = stale_reads.get_stale(("government_dashboard", current_user["user_id"]))
+        if cached is None:
+            raise
+        return cached
     except Exception as e:
         return {"error": str(e)}
@@ -0,0 +1,67 @@
+"""
+Production launcher: pre-forked uvicorn workers managed by gunicorn.
+
+    python -m app.server
+
+Workers default to one per CPU and run on uvloop/httptools. The app is
+imported once in the master (preload) and shared copy-on-write by the
+forked workers. On SIGTERM gunicorn stops accepting connections and gives
+in-flight requests WEB_GRACEFUL_TIMEOUT_SECONDS to finish.
+
+Use ``python -m app.main`` for the auto-reloading dev server.
+"""
+
+import multiprocessing
+from gunicorn.app.base import BaseApplication
+from uvicorn.workers import UvicornWorker
+from app.config import settings
+
+
+class ProductionWorker(UvicornWorker):
+    CONFIG_KWARGS = {
+        "loop": "uvloop",
+        "http": "httptools",
+        "lifespan": "on",
+        "timeout_graceful_shutdown": settings.WEB_GRACEFUL_TIMEOUT_SECONDS,
+    }
+
+
+class ProductionServer(BaseApplication):
+    def __init__(self, options: dict):
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        from app.main import app
+        return app
+
+
+def worker_count() -> int:
+    return settings.WEB_WORKERS or multiprocessing.cpu_count()
+
+
+def server_options() -> dict:
+    return {
+        "bind": f"{settings.WEB_HOST}:{settings.WEB_PORT}",
+        "workers": worker_count(),
+        "worker_class": "app.server.ProductionWorker",
+        "preload_app": True,
+        "keepalive": settings.WEB_KEEPALIVE_SECONDS,
+        "backlog": settings.WEB_BACKLOG,
+        "graceful_timeout": settings.WEB_GRACEFUL_TIMEOUT_SECONDS,
+        "timeout": settings.WEB_GRACEFUL_TIMEOUT_SECONDS * 2,
+        "accesslog": "-",
+        "errorlog": "-",
+    }
+
+
+def run():
+    ProductionServer(server_options()).run()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,209 @@
+import asyncio
+import bisect
+from collections import defaultdict
+from datetime import datetime, timezone, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from fastapi import HTTPException
+from app.config import settings
+from app.database import get_repository
+from app.middleware.staleness import mark_stale
+from app.repositories.base import Repository
+import logging
+
+logger = logging.getLogger(__name__)
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# Upper edges (seconds) of the duration histogram bins; the last bin is open-ended
+BIN_EDGES = [
+    60, 5 * 60, 15 * 60, 30 * 60, HOUR, 2 * HOUR, 4 * HOUR, 8 * HOUR, 12 * HOUR,
+    DAY, 2 * DAY, 3 * DAY, 7 * DAY, 14 * DAY, 30 * DAY,
+]
+
+METRICS = ("time_to_acknowledge", "time_to_resolve")
+GROUP_FIELDS = ("category", "department", "priority")
+PERCENTILES = (50, 90, 95)
+EVENT_PAGE_SIZE = 1000
+
+
+def epoch_seconds(value: Any) -> float:
+    if not isinstance(value, datetime):
+        value = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class Histogram:
+    """Fixed-bin duration histogram; mergeable, so buckets roll up cheaply"""
+
+    __slots__ = ("bins", "count", "total", "max")
+
+    def __init__(self):
+        self.bins = [0] * (len(BIN_EDGES) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.bins[bisect.bisect_left(BIN_EDGES, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def merge(self, other: "Histogram") -> None:
+        for i, n in enumerate(other.bins):
+            self.bins[i] += n
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, p: float) -> float:
+        """Estimate by linear interpolation inside the bin holding the p-th value"""
+        rank = self.count * p / 100
+        seen = 0
+        for i, n in enumerate(self.bins):
+            if n and seen + n >= rank:
+                lower = BIN_EDGES[i - 1] if i > 0 else 0
+                upper = min(BIN_EDGES[i], self.max) if i < len(BIN_EDGES) else self.max
+                return min(lower + (upper - lower) * (rank - seen) / n, self.max)
+            seen += n
+        return self.max
+
+    def summary(self) -> Dict[str, Any]:
+        if not self.count:
+            return {"count": 0}
+        result = {"count": self.count, "mean_seconds": round(self.total / self.count, 1)}
+        for p in PERCENTILES:
+            result[f"p{p}_seconds"] = round(self.percentile(p), 1)
+        result["max_seconds"] = round(self.max, 1)
+        return result
+
+
+class SLARollups:
+    """Time-to-acknowledge / time-to-resolve rollups folded from status events.
+
+    Each new event in ``issue_status_events`` is added to one hourly and one
+    daily histogram keyed by (metric, bucket start, category, department,
+    priority). Queries merge those buckets and never touch issue rows. Every
+    worker folds the same append-only log, reading only events past its
+    cursor, so they all converge on the same numbers.
+
+    The full replay happens once per worker, in the background from the
+    app lifespan (``warm``); requests only fold the events since.
+    """
+
+    def __init__(self):
+        self._buckets: Dict[int, Dict[Tuple, Histogram]] = {HOUR: defaultdict(Histogram), DAY: defaultdict(Histogram)}
+        self._cursor = 0
+        self._lock = asyncio.Lock()
+        self.caught_up = False  # a refresh has read the log to its end at least once
+
+    def fold(self, event: Dict[str, Any]) -> None:
+        to_status = event["to_status"]
+        metrics = []
+        if event.get("from_status") == "new" and to_status != "new":
+            metrics.append("time_to_acknowledge")
+        if to_status == "resolved":
+            metrics.append("time_to_resolve")
+        if not metrics:
+            return
+
+        changed_at = epoch_seconds(event["changed_at"])
+        duration = max(0.0, changed_at - epoch_seconds(event["issue_created_at"]))
+        dims = (event.get("category"), event.get("department"), event.get("priority"))
+        for name in metrics:
+            for size, buckets in self._buckets.items():
+                buckets[(name, int(changed_at // size) * size) + dims].add(duration)
+
+    async def refresh(self, repo: Repository) -> None:
+        """Fold events recorded since the last refresh"""
+        async with self._lock:
+            while True:
+                events = await repo.list_status_events(after_id=self._cursor, limit=EVENT_PAGE_SIZE)
+                for event in events:
+                    self.fold(event)
+                    self._cursor = max(self._cursor, int(event["id"]))
+                if len(events) < EVENT_PAGE_SIZE:
+                    break
+            self.caught_up = True
+
+    async def warm(self, get_repo: Callable[[], Repository], retry_seconds: float) -> None:
+        """Replay the whole log at worker start, retrying until the backend answers"""
+        while not self.caught_up:
+            try:
+                await self.refresh(get_repo())
+            except Exception as e:
+                logger.error(f"SLA rollup warm-up error: {str(e)}")
+                await asyncio.sleep(retry_seconds)
+        logger.info(f"SLA rollups warmed up to event {self._cursor}")
+
+    def query(self, start: float, end: float, group_by: List[str]) -> Dict[str, Any]:
+        # Hourly buckets for ranges up to a week, daily beyond that
+        size = HOUR if end - start <= 7 * DAY else DAY
+        first = int(start // size) * size
+        indexes = [GROUP_FIELDS.index(field) for field in group_by]
+
+        groups: Dict[Tuple, Dict[str, Histogram]] = defaultdict(lambda: {m: Histogram() for m in METRICS})
+        for key, histogram in self._buckets[size].items():
+            metric, bucket_start, dims = key[0], key[1], key[2:]
+            if first <= bucket_start < end:
+                groups[tuple(dims[i] for i in indexes)][metric].merge(histogram)
+
+        rows = []
+        for group_key, histograms in sorted(groups.items(), key=lambda item: tuple(str(v) for v in item[0])):
+            row = dict(zip(group_by, group_key))
+            for metric, histogram in histograms.items():
+                row[metric] = histogram.summary()
+            rows.append(row)
+
+        return {"bucket": "hour" if size == HOUR else "day", "groups": rows}
+
+
+sla_rollups = SLARollups()
+
+
+class AnalyticsService:
+    @staticmethod
+    async def get_sla_report(
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        group_by: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Acknowledge/resolve time percentiles per group between start and end"""
+        fields = [f.strip() for f in (group_by or "category").split(",") if f.strip()]
+        unknown = [f for f in fields if f not in GROUP_FIELDS]
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown group_by field(s) {unknown}; use {', '.join(GROUP_FIELDS)}"
+            )
+
+        end = end or datetime.now(timezone.utc)
+        start = start or end - timedelta(days=30)
+        if epoch_seconds(start) >= epoch_seconds(end):
+            raise HTTPException(status_code=400, detail="'from' must be before 'to'")
+
+        if not sla_rollups.caught_up:
+            # The lifespan warm-up is still replaying the log; don't do it in a request
+            raise HTTPException(
+                status_code=503,
+                detail="SLA history is still loading",
+                headers={"Retry-After": str(max(1, int(settings.SLA_WARMUP_RETRY_SECONDS)))}
+            )
+
+        try:
+            await sla_rollups.refresh(get_repository())
+        except Exception as e:
+            logger.error(f"SLA rollup refresh error: {str(e)}")
+            # Serve the last complete rollups, flagged stale like other reads during an outage
+            mark_stale()
+
+        report = sla_rollups.query(epoch_seconds(start), epoch_seconds(end), fields)
+        return {
+            "from": start,
+            "to": end,
+            "group_by": fields,
+            **report
+        }
@@ -1,6 +1,6 @@
 from typing import Dict, Any
 from fastapi import HTTPException, status
-from app.database import get_supabase
+from app.database import get_repository
 from app.auth.jwt_handler import create_access_token
 from app.models.auth_models import SignupRequest, LoginRequest, TokenResponse
 from app.config import settings
@@ -10,15 +10,15 @@ logger = logging.getLogger(__name__)
 
 class AuthService:
     @staticmethod
-    def signup(request: SignupRequest) -> TokenResponse:
+    async def signup(request: SignupRequest) -> TokenResponse:
         """Register new user"""
         try:
-            supabase = get_supabase()
+            repo = get_repository()
             
             # Check if user exists
-            existing = supabase.table("user_profiles").select("*").eq("phone_number", request.phone_number).execute()
+            existing = await repo.get_user_by_phone(request.phone_number)
             
-            if existing.data:
+            if existing:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="User with this phone number already exists"
@@ -34,13 +34,11 @@ class AuthService:
                 "status": "active"
             }
             
-            new_user = supabase.table("user_profiles").insert(user_data).execute()
+            user = await repo.create_user(user_data)
             
-            if not new_user.data:
+            if not user:
                 raise HTTPException(status_code=500, detail="Failed to create user")
             
-            user = new_user.data[0]
-            
             # Create JWT token
             token_data = {
                 "sub": user["id"],
@@ -70,22 +68,20 @@ class AuthService:
             raise HTTPException(status_code=500, detail="Signup failed")
     
     @staticmethod
-    def login(request: LoginRequest) -> TokenResponse:
+    async def login(request: LoginRequest) -> TokenResponse:
         """Login user"""
         try:
-            supabase = get_supabase()
+            repo = get_repository()
             
             # Find user
-            user_response = supabase.table("user_profiles").select("*").eq("phone_number", request.phone_number).execute()
+            user = await repo.get_user_by_phone(request.phone_number)
             
-            if not user_response.data:
+            if not user:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Invalid phone number or password"
                 )
             
-            user = user_response.data[0]
-            
             # Check password (hash comparison in production!)
             if user.get("password") != request.password:
                 raise HTTPException(
@@ -0,0 +1,260 @@
+import asyncio
+import base64
+import json
+import struct
+import time
+import zlib
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+import numpy as np
+from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
+from app.config import settings
+from app.database import get_repository
+from app.models.issue_models import IssueCategory
+from app.repositories.base import Repository
+from app.services.analytics_service import epoch_seconds
+
+CATEGORY_CODES = {category.value: code for code, category in enumerate(IssueCategory)}
+
+# At most PostgREST's default max-rows, or a short page would look like the end
+SNAPSHOT_PAGE_SIZE = 1000
+# Issues committed late can carry a created_at slightly behind ones already
+# loaded, so each refresh re-reads this far back and skips ids it has seen
+SNAPSHOT_OVERLAP_SECONDS = 300
+
+
+class PointColumns(NamedTuple):
+    lat: np.ndarray
+    lng: np.ndarray
+    category: np.ndarray
+    created_at: np.ndarray
+
+
+EMPTY_COLUMNS = PointColumns(
+    np.empty(0, dtype=np.float64), np.empty(0, dtype=np.float64),
+    np.empty(0, dtype=np.int8), np.empty(0, dtype=np.float64)
+)
+
+
+class IssuePointSnapshot:
+    """Columnar copy of every issue's coordinates, category and creation time.
+
+    Four flat NumPy arrays (about 21 bytes per issue). Those fields never
+    change once an issue exists, so at most every ``ttl`` seconds only issues
+    created since the last refresh are fetched, one bounded backend call per
+    page. ``version`` changes when new issues were added.
+
+    ``columns`` is replaced as a whole, never mutated, so renders running in
+    the threadpool keep a consistent view while a refresh lands.
+    """
+
+    def __init__(self, ttl: float, page_size: int = SNAPSHOT_PAGE_SIZE):
+        self.ttl = ttl
+        self.page_size = page_size
+        self.version = 0
+        self.columns = EMPTY_COLUMNS
+        self._newest: Optional[float] = None
+        self._recent: Dict[str, float] = {}      # issue_id -> created_at, within the overlap
+        self._built_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    async def ensure_fresh(self, repo: Repository) -> None:
+        async with self._lock:
+            if self._built_at is not None and time.monotonic() - self._built_at < self.ttl:
+                return
+            await self.refresh(repo)
+            self._built_at = time.monotonic()
+
+    async def refresh(self, repo: Repository) -> None:
+        after = None
+        if self._newest is not None:
+            after = (datetime.fromtimestamp(self._newest - SNAPSHOT_OVERLAP_SECONDS, timezone.utc), "")
+
+        chunks = []
+        while True:
+            page = await repo.list_issue_locations(after, self.page_size)
+            rows = [r for r in page if r["id"] not in self._recent]
+            if rows:
+                # Parsing rows is CPU work (NumPy releases the GIL), keep it off the event loop
+                chunks.append(await run_in_threadpool(self._columns, rows))
+            if len(page) < self.page_size:
+                break
+            after = (page[-1]["created_at"], page[-1]["id"])
+
+        if chunks:
+            self.columns = await run_in_threadpool(_concatenate, self.columns, chunks)
+            self.version += 1
+            cutoff = self._newest - SNAPSHOT_OVERLAP_SECONDS
+            self._recent = {issue_id: ts for issue_id, ts in self._recent.items() if ts >= cutoff}
+
+    def _columns(self, rows: List[Dict[str, Any]]) -> PointColumns:
+        n = len(rows)
+        created_at = np.fromiter((epoch_seconds(r["created_at"]) for r in rows), dtype=np.float64, count=n)
+
+        self._newest = max(self._newest or 0.0, float(created_at.max()))
+        cutoff = self._newest - SNAPSHOT_OVERLAP_SECONDS
+        self._recent.update((r["id"], ts) for r, ts in zip(rows, created_at.tolist()) if ts >= cutoff)
+
+        return PointColumns(
+            np.fromiter((r["location_lat"] for r in rows), dtype=np.float64, count=n),
+            np.fromiter((r["location_lng"] for r in rows), dtype=np.float64, count=n),
+            np.fromiter((CATEGORY_CODES.get(r["category"], -1) for r in rows), dtype=np.int8, count=n),
+            created_at,
+        )
+
+
+def _concatenate(current: PointColumns, chunks: List[PointColumns]) -> PointColumns:
+    return PointColumns(*(np.concatenate(parts) for parts in zip(current, *chunks)))
+
+
+def rasterize(
+    columns: PointColumns,
+    bbox: Tuple[float, float, float, float],
+    resolution: int,
+    category: Optional[str] = None,
+    since: Optional[float] = None
+) -> np.ndarray:
+    """Count issues per cell of a resolution x resolution grid; row 0 is the north edge"""
+    min_lng, min_lat, max_lng, max_lat = bbox
+    lat, lng = columns.lat, columns.lng
+
+    mask = (lng >= min_lng) & (lng < max_lng) & (lat >= min_lat) & (lat < max_lat)
+    if category is not None:
+        mask &= columns.category == CATEGORY_CODES[category]
+    if since is not None:
+        mask &= columns.created_at >= since
+
+    # Direct index arithmetic + bincount is several times faster than histogram2d
+    x = ((lng[mask] - min_lng) * (resolution / (max_lng - min_lng))).astype(np.intp)
+    y = ((max_lat - lat[mask]) * (resolution / (max_lat - min_lat))).astype(np.intp)
+    np.minimum(x, resolution - 1, out=x)
+    np.minimum(y, resolution - 1, out=y)
+
+    counts = np.bincount(y * resolution + x, minlength=resolution * resolution)
+    return counts.reshape(resolution, resolution).astype(np.uint32)
+
+
+def encode_png(grid: np.ndarray) -> bytes:
+    """Log-scaled yellow-to-red RGBA PNG, transparent where there are no issues"""
+    peak = int(grid.max())
+    level = np.log1p(grid) / np.log1p(peak) if peak else np.zeros(grid.shape)
+
+    height, width = grid.shape
+    rgba = np.empty((height, width, 4), dtype=np.uint8)
+    rgba[..., 0] = 255
+    rgba[..., 1] = (255 * (1 - level)).astype(np.uint8)
+    rgba[..., 2] = 0
+    rgba[..., 3] = np.where(grid > 0, 80 + 175 * level, 0).astype(np.uint8)
+
+    # Each scanline starts with filter type 0 (none)
+    raw = np.zeros((height, width * 4 + 1), dtype=np.uint8)
+    raw[:, 1:] = rgba.reshape(height, width * 4)
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(raw.tobytes(), 6))
+        + chunk(b"IEND", b"")
+    )
+
+
+def encode_counts(grid: np.ndarray, bounds: Tuple[float, float, float, float]) -> bytes:
+    """Compact JSON: counts as base64 little-endian integers, dense or sparse (whichever is smaller).
+
+    Counts use ``dtype`` (<u2 when every cell fits, else <u4); sparse indices are always <u4.
+
+    dense:  ``counts`` holds resolution * resolution values, row-major, row 0 north.
+    sparse: ``indices`` (flat row-major cell index) and ``counts`` for non-empty cells only.
+    """
+    flat = grid.ravel()
+    nonzero = np.flatnonzero(flat)
+    peak = int(flat.max()) if flat.size else 0
+    dtype = "<u2" if peak <= 0xFFFF else "<u4"
+    body: Dict[str, Any] = {
+        "bbox": list(bounds),
+        "resolution": grid.shape[0],
+        "dtype": dtype,
+        "total": int(flat.sum()),
+        "max": peak,
+    }
+    if 2 * nonzero.size < flat.size:
+        body["layout"] = "sparse"
+        body["indices"] = base64.b64encode(nonzero.astype("<u4").tobytes()).decode()
+        body["counts"] = base64.b64encode(flat[nonzero].astype(dtype).tobytes()).decode()
+    else:
+        body["layout"] = "dense"
+        body["counts"] = base64.b64encode(flat.astype(dtype).tobytes()).decode()
+    return json.dumps(body, separators=(",", ":")).encode()
+
+
+def parse_bbox(bbox: str) -> Tuple[float, float, float, float]:
+    try:
+        min_lng, min_lat, max_lng, max_lat = (float(v) for v in bbox.split(","))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="bbox must be min_lng,min_lat,max_lng,max_lat")
+
+    if not (-180 <= min_lng < max_lng <= 180 and -90 <= min_lat < max_lat <= 90):
+        raise HTTPException(status_code=400, detail="bbox is outside the map or has zero area")
+    return min_lng, min_lat, max_lng, max_lat
+
+
+def render(
+    columns: PointColumns,
+    bounds: Tuple[float, float, float, float],
+    resolution: int,
+    category: Optional[str],
+    since: Optional[float],
+    fmt: str
+) -> Tuple[bytes, str]:
+    grid = rasterize(columns, bounds, resolution, category, since)
+    if fmt == "png":
+        return encode_png(grid), "image/png"
+    return encode_counts(grid, bounds), "application/json"
+
+
+issue_points = IssuePointSnapshot(ttl=settings.HEATMAP_SNAPSHOT_SECONDS)
+# Encoded (body, media type) per parameter set, so cache hits skip all encoding
+_heatmap_cache: "OrderedDict[tuple, Tuple[bytes, str]]" = OrderedDict()
+_cached_version = 0
+
+
+class HeatmapService:
+    @staticmethod
+    async def get_heatmap(
+        bbox: str,
+        resolution: int,
+        category: Optional[str] = None,
+        since: Optional[datetime] = None,
+        fmt: str = "json"
+    ) -> Tuple[bytes, str]:
+        """Issue density grid over bbox, encoded as compact json or png; returns (body, media type)"""
+        global _cached_version
+        bounds = parse_bbox(bbox)
+        since_ts = epoch_seconds(since) if since else None
+
+        await issue_points.ensure_fresh(get_repository())
+        columns, version = issue_points.columns, issue_points.version
+        if version != _cached_version:
+            _heatmap_cache.clear()
+            _cached_version = version
+
+        key = (bounds, resolution, category, since_ts, fmt)
+        if key in _heatmap_cache:
+            _heatmap_cache.move_to_end(key)
+            return _heatmap_cache[key]
+
+        # Rasterizing and encoding take 100+ ms on large grids; NumPy and zlib release the GIL
+        result = await run_in_threadpool(render, columns, bounds, resolution, category, since_ts, fmt)
+
+        if issue_points.version != version:
+            # The snapshot moved on while rendering; don't cache an outdated grid
+            return result
+        _heatmap_cache[key] = result
+        if len(_heatmap_cache) > settings.HEATMAP_CACHE_SIZE:
+            _heatmap_cache.popitem(last=False)
+        return result
@@ -1,126 +1,158 @@
-from typing import List, Dict, Any, Optional
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Callable, Awaitable
 from fastapi import HTTPException, status
-from app.database import get_supabase
-from app.models.issue_models import IssueCreate, IssueUpdate, IssueResponse, CommentCreate, CommentResponse
+from app.config import settings
+from app.database import get_repository
+from app.repositories.resilience import BackendUnavailable
+from app.models.issue_models import (
+    IssueCreate, IssueUpdate, IssueResponse, IssueRecord, ReporterInfo,
+    NormalizedIssueList, CommentCreate, CommentResponse, DEPARTMENTS, canonical_department
+)
+from app.services.singleflight import SingleFlight
+from app.services.stale_cache import StaleCache
+from app.services.work_queue import WorkQueues, department_for
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Shared by all public issue reads; writes call forget() so callers see their own changes
+issue_reads = SingleFlight(window=settings.READ_COALESCE_WINDOW_SECONDS)
+
+# Last good read results, served while the backend is down
+stale_reads = StaleCache(max_entries=settings.STALE_CACHE_ENTRIES)
+
+work_queues = WorkQueues(
+    refresh_seconds=settings.QUEUE_REFRESH_SECONDS,
+    max_open_per_employee=settings.QUEUE_MAX_OPEN_PER_EMPLOYEE
+)
+
+async def record_transition(issue: Dict[str, Any], to_status: str, changed_by: Optional[str] = None) -> None:
+    """Log a status change for the SLA rollups; never fails the caller"""
+    from_status = issue.get("status")
+    if from_status == to_status:
+        return
+    try:
+        await get_repository().record_status_event({
+            "issue_id": issue["id"],
+            "from_status": from_status,
+            "to_status": to_status,
+            "category": issue["category"],
+            "priority": issue["priority"],
+            "department": department_for(issue["category"]),
+            "changed_by": changed_by,
+            "issue_created_at": issue["created_at"],
+            "changed_at": datetime.now(timezone.utc)
+        })
+    except Exception as e:
+        logger.error(f"Record status event error: {str(e)}")
+
+async def read_through(key: tuple, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Coalesced read that falls back to the last good result when the backend is unavailable"""
+    try:
+        result = await issue_reads.do(key, fetch)
+    except BackendUnavailable:
+        cached = stale_reads.get_stale(key)
+        if cached is None:
+            raise
+        return cached
+    stale_reads.put(key, result)
+    return result
+
 class IssueService:
     @staticmethod
-    def create_issue(issue_data: IssueCreate, user_id: str) -> IssueResponse:
+    async def create_issue(issue_data: IssueCreate, user_id: str) -> IssueResponse:
         """Create new issue"""
         try:
-            supabase = get_supabase()
+            repo = get_repository()
             
             issue_dict = issue_data.dict()
             issue_dict["user_id"] = user_id
             issue_dict["status"] = "new"
             
-            response = supabase.table("issues").insert(issue_dict).execute()
+            created_issue = await repo.create_issue(issue_dict)
             
-            if not response.data:
+            if not created_issue:
                 raise HTTPException(status_code=400, detail="Failed to create issue")
             
-            created_issue = response.data[0]
-            
-            # Get user info for response
-            user_info = supabase.table("user_profiles").select("full_name, phone_number").eq("id", user_id).execute()
-            
-            if user_info.data:
-                created_issue["reporter_name"] = user_info.data[0]["full_name"]
-                created_issue["reporter_phone"] = user_info.data[0]["phone_number"]
+            issue_reads.forget()
+            work_queues.add(created_issue)
             
             return IssueResponse(**created_issue)
             
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Create issue error: {str(e)}")
             raise HTTPException(status_code=500, detail="Failed to create issue")
     
     @staticmethod
-    def get_all_issues(
+    async def get_all_issues(
         category: Optional[str] = None, 
         status: Optional[str] = None,
         priority: Optional[str] = None
     ) -> List[IssueResponse]:
         """Get all issues with filtering"""
         try:
-            supabase = get_supabase()
-            
-            query = supabase.table("issues").select("""
-                *,
-                user_profiles!inner(full_name, phone_number)
-            """)
+            repo = get_repository()
             
-            if category:
-                query = query.eq("category", category)
-            if status:
-                query = query.eq("status", status)
-            if priority:
-                query = query.eq("priority", priority)
+            async def fetch() -> List[IssueResponse]:
+                rows = await repo.list_issues(category=category, status=status, priority=priority)
+                return [IssueResponse(**item) for item in rows]
             
-            response = query.order("created_at", desc=True).execute()
-            
-            issues = []
-            for item in response.data:
-                issue_dict = {**item}
-                issue_dict["reporter_name"] = item["user_profiles"]["full_name"]
-                issue_dict["reporter_phone"] = item["user_profiles"]["phone_number"]
-                del issue_dict["user_profiles"]
-                issues.append(IssueResponse(**issue_dict))
-            
-            return issues
+            key = ("issues", category or None, status or None, priority or None)
+            return await read_through(key, fetch)
             
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Get issues error: {str(e)}")
-            return []
+            raise HTTPException(status_code=500, detail="Failed to get issues")
+    
+    @staticmethod
+    def normalize(issues: List[IssueResponse]) -> NormalizedIssueList:
+        """Move reporter details out of the rows into a reporters map"""
+        reporters: Dict[str, ReporterInfo] = {}
+        records = []
+        for issue in issues:
+            if issue.user_id not in reporters:
+                reporters[issue.user_id] = ReporterInfo(name=issue.reporter_name, phone=issue.reporter_phone)
+            records.append(IssueRecord.model_construct(**issue.model_dump(exclude={"reporter_name", "reporter_phone"})))
+        return NormalizedIssueList(reporters=reporters, issues=records)
     
     @staticmethod
-    def get_user_issues(user_id: str) -> List[IssueResponse]:
+    async def get_user_issues(user_id: str) -> List[IssueResponse]:
         """Get issues created by specific user"""
         try:
-            supabase = get_supabase()
+            repo = get_repository()
             
-            response = supabase.table("issues").select("""
-                *,
-                user_profiles!inner(full_name, phone_number)
-            """).eq("user_id", user_id).order("created_at", desc=True).execute()
+            async def fetch() -> List[IssueResponse]:
+                rows = await repo.list_issues(user_id=user_id)
+                return [IssueResponse(**item) for item in rows]
             
-            issues = []
-            for item in response.data:
-                issue_dict = {**item}
-                issue_dict["reporter_name"] = item["user_profiles"]["full_name"]
-                issue_dict["reporter_phone"] = item["user_profiles"]["phone_number"]
-                del issue_dict["user_profiles"]
-                issues.append(IssueResponse(**issue_dict))
-            
-            return issues
+            return await read_through(("user_issues", user_id), fetch)
             
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Get user issues error: {str(e)}")
-            return []
+            raise HTTPException(status_code=500, detail="Failed to get issues")
     
     @staticmethod
-    def get_issue_by_id(issue_id: str) -> IssueResponse:
+    async def get_issue_by_id(issue_id: str) -> IssueResponse:
         """Get single issue by ID"""
         try:
-            supabase = get_supabase()
+            repo = get_repository()
             
-            response = supabase.table("issues").select("""
-                *,
-                user_profiles!inner(full_name, phone_number)
-            """).eq("id", issue_id).execute()
+            async def fetch() -> Optional[IssueResponse]:
+                item = await repo.get_issue(issue_id)
+                return IssueResponse(**item) if item else None
             
-            if not response.data:
-                raise HTTPException(status_code=404, detail="Issue not found")
+            issue = await read_through(("issue", issue_id), fetch)
             
-            item = response.data[0]
-            issue_dict = {**item}
-            issue_dict["reporter_name"] = item["user_profiles"]["full_name"]
-            issue_dict["reporter_phone"] = item["user_profiles"]["phone_number"]
-            del issue_dict["user_profiles"]
+            if not issue:
+                raise HTTPException(status_code=404, detail="Issue not found")
             
-            return IssueResponse(**issue_dict)
+            return issue
             
         except HTTPException:
             raise
@@ -129,20 +161,29 @@ class IssueService:
             raise HTTPException(status_code=500, detail="Failed to get issue")
     
     @staticmethod
-    def update_issue(issue_id: str, update_data: IssueUpdate) -> IssueResponse:
+    async def update_issue(issue_id: str, update_data: IssueUpdate, changed_by: Optional[str] = None) -> IssueResponse:
         """Update issue (for employees)"""
         try:
-            supabase = get_supabase()
+            repo = get_repository()
             
             update_dict = update_data.dict(exclude_unset=True)
             
-            response = supabase.table("issues").update(update_dict).eq("id", issue_id).execute()
+            # Previous state is needed to log the status transition
+            before = await repo.get_issue(issue_id) if update_dict.get("status") else None
             
-            if not response.data:
+            updated = await repo.update_issue(issue_id, update_dict)
+            
+            if not updated:
                 raise HTTPException(status_code=404, detail="Issue not found")
             
+            if before:
+                await record_transition(before, updated["status"], changed_by)
+            
+            issue_reads.forget()
+            work_queues.update(updated)
+            
             # Get updated issue with user info
-            return IssueService.get_issue_by_id(issue_id)
+            return await IssueService.get_issue_by_id(issue_id)
             
         except HTTPException:
             raise
@@ -151,15 +192,48 @@ class IssueService:
             raise HTTPException(status_code=500, detail="Failed to update issue")
     
     @staticmethod
-    def vote_on_issue(issue_id: str, user_id: str, vote_type: str) -> Dict[str, Any]:
+    async def claim_next_issue(employee_id: str) -> IssueResponse:
+        """Assign the top queued issue of the employee's department to them"""
+        try:
+            repo = get_repository()
+            
+            employee = await repo.get_user_by_id(employee_id)
+            
+            if not employee or not canonical_department(employee.get("department")):
+                # Profiles created before signup validated the department
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Your profile has no valid department; must be one of: {', '.join(DEPARTMENTS)}"
+                )
+            
+            result = await work_queues.claim(repo, employee_id, employee["department"])
+            
+            if not result:
+                raise HTTPException(status_code=404, detail="No issues waiting in your department queue")
+            
+            queued, claimed = result
+            await record_transition(queued, claimed["status"], employee_id)
+            
+            issue_reads.forget()
+            
+            return await IssueService.get_issue_by_id(claimed["id"])
+            
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Claim issue error: {str(e)}")
+            raise HTTPException(status_code=500, detail="Failed to claim issue")
+    
+    @staticmethod
+    async def vote_on_issue(issue_id: str, user_id: str, vote_type: str) -> Dict[str, Any]:
         """Vote on an issue"""
         try:
-            supabase = get_supabase()
+            repo = get_repository()
             
             # Check if already voted
-            existing = supabase.table("votes").select("*").eq("user_id", user_id).eq("issue_id", issue_id).execute()
+            existing = await repo.get_vote(issue_id, user_id)
             
-            if existing.data:
+            if existing:
                 raise HTTPException(status_code=400, detail="Already voted on this issue")
             
             # Create vote
@@ -169,11 +243,13 @@ class IssueService:
                 "vote_type": vote_type
             }
             
-            response = supabase.table("votes").insert(vote_data).execute()
+            created = await repo.create_vote(vote_data)
             
-            if not response.data:
+            if not created:
                 raise HTTPException(status_code=400, detail="Failed to vote")
             
+            work_queues.vote(issue_id, vote_type)
+            
             return {"success": True, "message": "Vote recorded"}
             
         except HTTPException:
@@ -183,10 +259,10 @@ class IssueService:
             raise HTTPException(status_code=500, detail="Failed to vote")
     
     @staticmethod
-    def add_comment(issue_id: str, user_id: str, comment_data: CommentCreate) -> CommentResponse:
+    async def add_comment(issue_id: str, user_id: str, comment_data: CommentCreate) -> CommentResponse:
         """Add comment to issue"""
         try:
-            supabase = get_supabase()
+            repo = get_repository()
             
             comment_dict = {
                 "issue_id": issue_id,
@@ -194,17 +270,12 @@ class IssueService:
                 "content": comment_data.content
             }
             
-            response = supabase.table("comments").insert(comment_dict).execute()
+            comment = await repo.create_comment(comment_dict)
             
-            if not response.data:
+            if not comment:
                 raise HTTPException(status_code=400, detail="Failed to add comment")
             
-            comment = response.data[0]
-            
-            # Get commenter name
-            user_info = supabase.table("user_profiles").select("full_name").eq("id", user_id).execute()
-            if user_info.data:
-                comment["commenter_name"] = user_info.data[0]["full_name"]
+            issue_reads.forget()
             
             return CommentResponse(**comment)
             
@@ -215,22 +286,19 @@ class IssueService:
             raise HTTPException(status_code=500, detail="Failed to add comment")
     
     @staticmethod
-    def get_issue_comments(issue_id: str) -> List[CommentResponse]:
+    async def get_issue_comments(issue_id: str) -> List[CommentResponse]:
         """Get comments for an issue"""
         try:
-            supabase = get_supabase()
-            
-            response = supabase.table("comments").select("*, user_profiles!inner(full_name)").eq("issue_id", issue_id).order("created_at", desc=True).execute()
+            repo = get_repository()
             
-            comments = []
-            for item in response.data:
-                comment_dict = {**item}
-                comment_dict["commenter_name"] = item["user_profiles"]["full_name"]
-                del comment_dict["user_profiles"]
-                comments.append(CommentResponse(**comment_dict))
+            async def fetch() -> List[CommentResponse]:
+                rows = await repo.list_comments(issue_id)
+                return [CommentResponse(**item) for item in rows]
             
-            return comments
+            return await read_through(("comments", issue_id), fetch)
             
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Get comments error: {str(e)}")
-            return []
+            raise HTTPException(status_code=500, detail="Failed to get comments")
@@ -0,0 +1,52 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Collapse identical concurrent calls into one backend call.
+
+    Callers that ask for the same key while a call is in flight (or within
+    ``window`` seconds after it finished) await the same task and share its
+    result. Failures are never kept, so the next caller retries.
+    """
+
+    def __init__(self, window: float = 0.0):
+        self.window = window
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.requests = 0
+        self.executions = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        self.requests += 1
+        task = self._calls.get(key)
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda t: self._finished(key, t))
+        # Shield so one disconnecting client doesn't cancel the shared call
+        return await asyncio.shield(task)
+
+    def _finished(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is not task:
+            return
+        if task.cancelled() or task.exception() is not None or self.window <= 0:
+            del self._calls[key]
+        else:
+            asyncio.get_running_loop().call_later(self.window, self._evict, key, task)
+
+    def _evict(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+    def forget(self) -> None:
+        """Drop all shared results so the next read hits the backend (call after writes)"""
+        self._calls.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "requests": self.requests,
+            "backend_calls": self.executions,
+            "collapsed": self.requests - self.executions,
+            "in_flight": sum(1 for t in self._calls.values() if not t.done())
+        }
@@ -0,0 +1,28 @@
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+from app.middleware.staleness import mark_stale
+
+
+class StaleCache:
+    """Last good result per read, served (flagged stale) while the backend is unavailable"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.served = 0
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get_stale(self, key: Hashable) -> Optional[Any]:
+        value = self._entries.get(key)
+        if value is not None:
+            self.served += 1
+            mark_stale()
+        return value
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "served_stale": self.served}
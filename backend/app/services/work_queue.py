@@ -0,0 +1,169 @@
+import asyncio
+import heapq
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from fastapi import HTTPException, status
+from app.models.issue_models import CATEGORY_DEPARTMENTS, OPEN_STATUSES
+from app.repositories.base import OpenLimitReached, Repository
+
+PRIORITY_RANK = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
+
+def department_for(category: str) -> str:
+    return CATEGORY_DEPARTMENTS.get(category, "General")
+
+
+def _normalize_department(department: Optional[str]) -> str:
+    return (department or "").strip().lower()
+
+
+def _timestamp(value: Any) -> float:
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+
+
+def _sort_key(issue: Dict[str, Any]) -> tuple:
+    # Highest priority first, then most upvoted, then oldest
+    return (
+        PRIORITY_RANK.get(issue.get("priority"), PRIORITY_RANK["medium"]),
+        -issue.get("upvotes", 0),
+        _timestamp(issue["created_at"]),
+    )
+
+
+class WorkQueues:
+    """Per-department priority queues of unassigned open issues.
+
+    Each department is a binary heap, so claiming the next issue is
+    O(log n). Re-prioritised or removed issues are marked dead and skipped
+    when popped instead of being searched for. Open load per employee is
+    counted incrementally.
+
+    The heaps are local to the worker process and rebuilt from the backend
+    every ``refresh_seconds``; the claim itself is a compare-and-set in the
+    backend, so two workers can never hand out the same issue. The open-issue
+    cap is counted by the backend in that same claim, since the local loads
+    only see this worker's claims.
+    """
+
+    def __init__(self, refresh_seconds: float, max_open_per_employee: int):
+        self.refresh_seconds = refresh_seconds
+        self.max_open_per_employee = max_open_per_employee
+        self._heaps: Dict[str, list] = defaultdict(list)
+        self._entries: Dict[str, list] = {}      # issue_id -> live heap entry
+        self._assignees: Dict[str, str] = {}     # open assigned issue_id -> employee_id
+        self._loads: Dict[str, int] = defaultdict(int)
+        self._loaded_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    async def ensure_loaded(self, repo: Repository) -> None:
+        """Rebuild the heaps if they are stale, serialised with claims"""
+        async with self._lock:
+            await self._ensure_loaded(repo)
+
+    async def _ensure_loaded(self, repo: Repository) -> None:
+        if self._loaded_at is not None and time.monotonic() - self._loaded_at < self.refresh_seconds:
+            return
+        rows = await repo.list_open_issues()
+        self._heaps.clear()
+        self._entries.clear()
+        self._assignees.clear()
+        self._loads.clear()
+        for issue in rows:
+            self._track(issue)
+        self._loaded_at = time.monotonic()
+
+    def _track(self, issue: Dict[str, Any]) -> None:
+        if issue.get("status") not in OPEN_STATUSES:
+            return
+        if issue.get("assigned_to"):
+            self._assignees[issue["id"]] = issue["assigned_to"]
+            self._loads[issue["assigned_to"]] += 1
+        else:
+            self._push(issue)
+
+    def _push(self, issue: Dict[str, Any]) -> None:
+        entry = [_sort_key(issue), issue["id"], issue, True]
+        self._entries[issue["id"]] = entry
+        heapq.heappush(self._heaps[_normalize_department(department_for(issue["category"]))], entry)
+
+    def _discard(self, issue_id: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.pop(issue_id, None)
+        if entry is None:
+            return None
+        entry[3] = False
+        return entry[2]
+
+    def _release(self, issue_id: str) -> None:
+        employee_id = self._assignees.pop(issue_id, None)
+        if employee_id is not None:
+            self._loads[employee_id] = max(0, self._loads[employee_id] - 1)
+
+    # Incremental maintenance (no-ops until the first load)
+    def add(self, issue: Dict[str, Any]) -> None:
+        if self._loaded_at is not None:
+            self._track({"upvotes": 0, **issue})
+
+    def update(self, issue: Dict[str, Any]) -> None:
+        if self._loaded_at is None:
+            return
+        previous = self._discard(issue["id"])
+        self._release(issue["id"])
+        upvotes = previous.get("upvotes", 0) if previous else 0
+        self._track({"upvotes": upvotes, **issue})
+
+    def vote(self, issue_id: str, vote_type: str) -> None:
+        if vote_type != "upvote":
+            return
+        issue = self._discard(issue_id)
+        if issue is not None:
+            self._push({**issue, "upvotes": issue.get("upvotes", 0) + 1})
+
+    def load(self, employee_id: str) -> int:
+        return self._loads.get(employee_id, 0)
+
+    def peek(self, department: Optional[str], limit: int = 10) -> List[Dict[str, Any]]:
+        heap = self._heaps.get(_normalize_department(department), [])
+        return [entry[2] for entry in heapq.nsmallest(limit, (e for e in heap if e[3]))]
+
+    async def claim(
+        self, repo: Repository, employee_id: str, department: Optional[str]
+    ) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """Pop the top issue of the department and assign it to the employee.
+
+        Returns the queued snapshot (pre-claim state) and the claimed row.
+        """
+        async with self._lock:
+            await self._ensure_loaded(repo)
+
+            heap = self._heaps.get(_normalize_department(department), [])
+            while heap:
+                entry = heapq.heappop(heap)
+                if not entry[3]:
+                    continue
+
+                try:
+                    claimed = await repo.claim_issue(
+                        entry[1], employee_id, entry[2]["status"], self.max_open_per_employee
+                    )
+                except OpenLimitReached:
+                    heapq.heappush(heap, entry)
+                    raise HTTPException(
+                        status_code=status.HTTP_409_CONFLICT,
+                        detail=f"You already have {self.max_open_per_employee} open issues assigned"
+                    )
+                except Exception:
+                    # The backend failed, nobody took the issue: keep it queued
+                    heapq.heappush(heap, entry)
+                    raise
+                self._discard(entry[1])
+                if claimed:
+                    self._assignees[claimed["id"]] = employee_id
+                    self._loads[employee_id] += 1
+                    return entry[2], claimed
+                # Taken or moved on through another worker since the last refresh
+
+            return None
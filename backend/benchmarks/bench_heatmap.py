@@ -0,0 +1,95 @@
+"""
+Time the heatmap endpoint path over a synthetic snapshot of issue coordinates:
+rasterize + encode (uncached) and cache hits, through to the HTTP response.
+
+    python benchmarks/bench_heatmap.py --points 1000000 --resolution 256
+"""
+
+import argparse
+import asyncio
+import math
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_BACKEND", "sql")
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from fastapi.responses import Response  # noqa: E402
+from app.services import heatmap_service  # noqa: E402
+from app.services.heatmap_service import (  # noqa: E402
+    HeatmapService, PointColumns, issue_points, rasterize, CATEGORY_CODES
+)
+
+# Rough bounding box of a large city
+BBOX = (77.45, 12.80, 77.80, 13.15)
+
+
+def load_snapshot(points: int) -> None:
+    rng = np.random.default_rng(0)
+    # Clustered around a few hotspots, like real reports
+    centers = rng.uniform(BBOX[:2], BBOX[2:], size=(20, 2))
+    picks = centers[rng.integers(0, len(centers), points)]
+    coords = picks + rng.normal(0, 0.01, size=(points, 2))
+    issue_points.columns = PointColumns(
+        lat=coords[:, 1].copy(),
+        lng=coords[:, 0].copy(),
+        category=rng.integers(0, len(CATEGORY_CODES), points).astype(np.int8),
+        created_at=rng.uniform(time.time() - 365 * 86400, time.time(), points),
+    )
+    issue_points.version += 1
+    # Never refresh from the backend during the run
+    issue_points.ttl = math.inf
+    issue_points._built_at = time.monotonic()
+
+
+async def endpoint(bbox: str, resolution: int, category, fmt: str) -> Response:
+    body, media_type = await HeatmapService.get_heatmap(bbox, resolution, category, None, fmt)
+    return Response(content=body, media_type=media_type)
+
+
+def timed_sync(fn, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+async def timed(fn, repeat: int, clear_cache: bool):
+    total = 0.0
+    for _ in range(repeat):
+        if clear_cache:
+            heatmap_service._heatmap_cache.clear()
+        started = time.perf_counter()
+        result = await fn()
+        total += time.perf_counter() - started
+    return result, total / repeat * 1000
+
+
+async def run(args) -> None:
+    load_snapshot(args.points)
+    bbox = ",".join(str(v) for v in BBOX)
+
+    raster_ms = timed_sync(lambda: rasterize(issue_points.columns, BBOX, args.resolution), args.repeat)
+    print(f"{args.points:,} points, {args.resolution}x{args.resolution} grid")
+    print(f"{'rasterize only':<28}{raster_ms:>9.1f} ms")
+    print(f"{'case':<28}{'uncached':>9}{'cached':>10}{'bytes':>12}")
+    for label, category, fmt in [("json", None, "json"), ("json category=roads", "roads", "json"), ("png", None, "png")]:
+        fn = lambda: endpoint(bbox, args.resolution, category, fmt)  # noqa: E731
+        response, cold_ms = await timed(fn, args.repeat, True)
+        _, warm_ms = await timed(fn, args.repeat, False)
+        print(f"{label:<28}{cold_ms:>6.1f} ms{warm_ms:>7.2f} ms{len(response.body):>12,}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--points", type=int, default=1_000_000)
+    parser.add_argument("--resolution", type=int, default=256)
+    parser.add_argument("--repeat", type=int, default=10)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Compare the dev entry point (python -m app.main) with the production
+launcher (python -m app.server) under concurrent load.
+
+    python benchmarks/bench_server.py --seconds 10 --concurrency 64
+
+Both servers run against a throwaway SQLite database so the numbers measure
+the server, not Supabase latency.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PATHS = ["/health", "/api/v1/issues/"]
+
+
+def start(module: str, port: int, env: dict) -> subprocess.Popen:
+    proc = subprocess.Popen(
+        [sys.executable, "-m", module],
+        cwd=BACKEND_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/health", timeout=1)
+            return proc
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    proc.terminate()
+    raise RuntimeError(f"{module} did not start on port {port}")
+
+
+async def load(base_url: str, path: str, seconds: float, concurrency: int) -> dict:
+    latencies = []
+    errors = 0
+    deadline = time.perf_counter() + seconds
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=10) as client:
+        async def worker():
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                try:
+                    response = await client.get(path)
+                    response.raise_for_status()
+                    latencies.append(time.perf_counter() - started)
+                except httpx.HTTPError:
+                    errors += 1
+
+        await asyncio.gather(*[worker() for _ in range(concurrency)])
+
+    latencies.sort()
+    return {
+        "rps": len(latencies) / seconds,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else 0,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000 if latencies else 0,
+        "errors": errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=0)
+    args = parser.parse_args()
+
+    db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    env = {
+        **os.environ,
+        "DATABASE_BACKEND": "sql",
+        "DATABASE_URL": f"sqlite+aiosqlite:///{db_path}",
+        "WEB_PORT": "8001",
+        "WEB_WORKERS": str(args.workers),
+    }
+    servers = [("dev (app.main)", "app.main", 8000), ("production (app.server)", "app.server", 8001)]
+
+    print(f"{'server':<26}{'path':<18}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for label, module, port in servers:
+        proc = start(module, port, env)
+        try:
+            for path in PATHS:
+                result = asyncio.run(load(f"http://127.0.0.1:{port}", path, args.seconds, args.concurrency))
+                print(f"{label:<26}{path:<18}{result['rps']:>10.0f}{result['p50_ms']:>10.1f}"
+                      f"{result['p99_ms']:>10.1f}{result['errors']:>8}")
+        finally:
+            proc.terminate()
+            proc.wait(timeout=60)
+
+
+if __name__ == "__main__":
+    main()
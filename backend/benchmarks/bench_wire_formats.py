@@ -0,0 +1,93 @@
+"""
+Bytes on the wire and encode CPU for the GET /issues payload per format.
+
+    python benchmarks/bench_wire_formats.py --issues 2000 --reporters 300
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+import brotli
+import msgpack
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from app.models.issue_models import IssueResponse, IssueCategory, IssuePriority  # noqa: E402
+from app.services.issue_service import IssueService  # noqa: E402
+
+
+def make_issues(count: int, reporters: int):
+    rng = random.Random(0)
+    now = datetime.now(timezone.utc)
+    people = [(f"user-{i:08d}", f"Reporter Number {i}", f"+91{rng.randrange(10**9, 10**10)}") for i in range(reporters)]
+    issues = []
+    for i in range(count):
+        user_id, name, phone = rng.choice(people)
+        created = now - timedelta(minutes=rng.randrange(0, 60 * 24 * 90))
+        issues.append(IssueResponse(
+            id=f"issue-{i:08d}",
+            user_id=user_id,
+            title=f"Pothole near junction {i}",
+            description="Large pothole causing traffic to swerve into the next lane during rush hour.",
+            category=rng.choice(list(IssueCategory)).value,
+            priority=rng.choice(list(IssuePriority)).value,
+            status="new",
+            location_lat=12.9 + rng.random() / 5,
+            location_lng=77.5 + rng.random() / 5,
+            location_address=f"{rng.randrange(1, 500)} MG Road, Bengaluru",
+            image_urls=[],
+            created_at=created,
+            updated_at=created,
+            reporter_name=name,
+            reporter_phone=phone,
+        ))
+    return issues
+
+
+def timed(fn, repeat: int):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return result, (time.perf_counter() - started) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--issues", type=int, default=2000)
+    parser.add_argument("--reporters", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    issues = make_issues(args.issues, args.reporters)
+    shapes = {
+        "full": jsonable_encoder(issues),
+        "normalized": jsonable_encoder(IssueService.normalize(issues)),
+    }
+    encoders = {
+        "json": lambda c: json.dumps(c, separators=(",", ":")).encode(),
+        "msgpack": lambda c: msgpack.packb(c, use_bin_type=True),
+    }
+    compressors = {
+        "identity": lambda b: b,
+        "gzip-6": lambda b: gzip.compress(b, compresslevel=6),
+        "br-4": lambda b: brotli.compress(b, quality=4),
+    }
+
+    print(f"{args.issues} issues from {args.reporters} reporters")
+    print(f"{'shape':<12}{'format':<9}{'encoding':<10}{'bytes':>10}{'encode ms':>11}{'compress ms':>13}")
+    for shape, content in shapes.items():
+        for fmt, encode in encoders.items():
+            body, encode_ms = timed(lambda: encode(content), args.repeat)
+            for name, compress in compressors.items():
+                wire, compress_ms = timed(lambda: compress(body), args.repeat)
+                print(f"{shape:<12}{fmt:<9}{name:<10}{len(wire):>10,}{encode_ms:>11.2f}{compress_ms:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+-- Append-only log of issue status transitions, read by the SLA rollups.
+-- Issue fields are copied in so the rollups never read the issues table.
+-- Mirrors issue_status_events in app/repositories/sql_repository.py.
+CREATE TABLE IF NOT EXISTS public.issue_status_events (
+  id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+  issue_id UUID NOT NULL REFERENCES public.issues(id) ON DELETE CASCADE,
+  from_status TEXT,
+  to_status TEXT NOT NULL,
+  category TEXT NOT NULL,
+  priority TEXT NOT NULL,
+  department TEXT,
+  changed_by UUID,
+  issue_created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+  changed_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+);
+
+-- The backend uses the service key; nothing else reads or writes this table
+ALTER TABLE public.issue_status_events ENABLE ROW LEVEL SECURITY;
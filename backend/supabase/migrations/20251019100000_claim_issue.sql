@@ -0,0 +1,45 @@
+-- Claims an issue for an employee, enforcing the open-issue cap in the same
+-- transaction as the compare-and-set so it holds across backend workers.
+-- Mirrors SQLRepository.claim_issue in app/repositories/sql_repository.py.
+CREATE INDEX IF NOT EXISTS ix_issues_assigned_to_status ON public.issues(assigned_to, status);
+-- Keyset index for the heatmap snapshot pages (list_issue_locations)
+CREATE INDEX IF NOT EXISTS ix_issues_created_at_id ON public.issues(created_at, id);
+
+CREATE OR REPLACE FUNCTION public.claim_issue(
+  p_issue_id UUID,
+  p_employee_id UUID,
+  p_current_status TEXT,
+  p_max_open INTEGER
+)
+RETURNS SETOF public.issues
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  open_count INTEGER;
+BEGIN
+  -- Serialises one employee's claims so two can't both pass the count
+  PERFORM 1 FROM public.user_profiles WHERE id = p_employee_id FOR UPDATE;
+
+  SELECT count(*) INTO open_count
+  FROM public.issues
+  WHERE assigned_to = p_employee_id
+    AND status IN ('new', 'acknowledged', 'in_progress');
+
+  IF open_count >= p_max_open THEN
+    RAISE EXCEPTION 'open issue limit reached' USING ERRCODE = 'UE001';
+  END IF;
+
+  -- Only new issues are acknowledged, later statuses are kept
+  RETURN QUERY
+  UPDATE public.issues
+  SET assigned_to = p_employee_id,
+      status = CASE WHEN p_current_status = 'new' THEN 'acknowledged' ELSE status END
+  WHERE id = p_issue_id
+    AND assigned_to IS NULL
+    AND status = p_current_status
+  RETURNING *;
+END;
+$$;
+
+-- Only the backend (service key) claims issues
+REVOKE EXECUTE ON FUNCTION public.claim_issue(UUID, UUID, TEXT, INTEGER) FROM PUBLIC, anon, authenticated;
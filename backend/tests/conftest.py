@@ -0,0 +1,75 @@
+import os
+import tempfile
+
+# Settings are read at import time, so point the app at SQLite before importing it
+os.environ.setdefault("DATABASE_BACKEND", "sql")
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/urban_eye_test.db")
+os.environ.setdefault("BACKEND_RETRY_BACKOFF_SECONDS", "0")
+
+import pytest
+from collections import OrderedDict
+from fastapi.testclient import TestClient
+from app import database
+from app.config import settings
+from app.repositories.sql_repository import SQLRepository
+from app.services.issue_service import issue_reads, stale_reads, work_queues
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def repo(tmp_path):
+    """A fresh SQLite-backed repository per test"""
+    repository = SQLRepository(f"sqlite+aiosqlite:///{tmp_path}/repo.db")
+    await repository.connect()
+    yield repository
+    await repository.close()
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """The app on its own SQLite database, with per-process caches reset"""
+    from app.main import app
+    monkeypatch.setattr(settings, "DATABASE_BACKEND", "sql")
+    monkeypatch.setattr(settings, "DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path}/app.db")
+    monkeypatch.setattr(stale_reads, "_entries", OrderedDict())
+    monkeypatch.setattr(work_queues, "_loaded_at", None)
+    issue_reads.forget()
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def signup(client: TestClient, phone_number: str, role: str = "citizen", department: str = None) -> dict:
+    """Register a user and return auth headers for them"""
+    body = {"full_name": "Test User", "phone_number": phone_number, "password": "pass1234", "role": role}
+    if department:
+        body["department"] = department
+    response = client.post("/api/v1/auth/signup", json=body)
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def break_backend(*method_names):
+    """Make the inner repository's methods fail as if the backend were unreachable"""
+    async def unreachable(*args, **kwargs):
+        raise OSError("connection refused")
+    inner = database.get_repository().inner
+    for name in method_names:
+        setattr(inner, name, unreachable)
+    # Don't let results shared within the coalescing window hide the outage
+    issue_reads.forget()
+
+
+def new_issue(**overrides) -> dict:
+    return {
+        "title": "Pothole on Main St",
+        "description": "Large pothole near the bus stop",
+        "category": "roads",
+        "priority": "medium",
+        "location_lat": 12.97,
+        "location_lng": 77.59,
+        **overrides
+    }
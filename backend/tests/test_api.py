@@ -0,0 +1,92 @@
+from conftest import break_backend, new_issue, signup
+
+
+def test_create_and_list_issues(client):
+    citizen = signup(client, "+15550000001")
+    created = client.post("/api/v1/issues/", json=new_issue(), headers=citizen)
+    assert created.status_code == 200, created.text
+
+    issues = client.get("/api/v1/issues/").json()
+    assert [i["id"] for i in issues] == [created.json()["id"]]
+    assert issues[0]["reporter_name"] == "Test User"
+
+    normalized = client.get("/api/v1/issues/", params={"shape": "normalized"}).json()
+    assert list(normalized["reporters"].values()) == [{"name": "Test User", "phone": "+15550000001"}]
+
+
+def test_stale_reads_served_while_backend_is_down(client):
+    citizen = signup(client, "+15550000001")
+    client.post("/api/v1/issues/", json=new_issue(), headers=citizen)
+    fresh = client.get("/api/v1/issues/")
+    assert "x-data-stale" not in fresh.headers
+
+    break_backend("list_issues")
+
+    stale = client.get("/api/v1/issues/")
+    assert stale.status_code == 200
+    assert stale.headers["x-data-stale"] == "true"
+    assert stale.json() == fresh.json()
+
+    # Nothing cached for this filter, so there is nothing to fall back to
+    uncached = client.get("/api/v1/issues/", params={"category": "parks"})
+    assert uncached.status_code == 503
+
+
+def test_claim_next_issue_hands_out_each_issue_once(client):
+    citizen = signup(client, "+15550000001")
+    first = signup(client, "+15550000002", role="employee", department="Public Works")
+    second = signup(client, "+15550000003", role="employee", department="Public Works")
+    urgent = client.post("/api/v1/issues/", json=new_issue(priority="critical"), headers=citizen).json()
+    routine = client.post("/api/v1/issues/", json=new_issue(priority="low"), headers=citizen).json()
+
+    claimed = client.get("/api/v1/issues/queue/next", headers=first)
+    assert claimed.status_code == 200
+    assert claimed.json()["id"] == urgent["id"]
+    assert claimed.json()["status"] == "acknowledged"
+
+    assert client.get("/api/v1/issues/queue/next", headers=second).json()["id"] == routine["id"]
+    assert client.get("/api/v1/issues/queue/next", headers=second).status_code == 404
+    assert client.get("/api/v1/issues/queue/next", headers=citizen).status_code == 403
+
+
+def test_signup_requires_a_known_department_for_employees(client):
+    body = {"full_name": "Test User", "phone_number": "+15550000002", "password": "pass1234", "role": "employee"}
+
+    for department in (None, "Roads Dept"):
+        response = client.post("/api/v1/auth/signup", json={**body, "department": department} if department else body)
+        assert response.status_code == 422
+        assert "Public Works" in response.text
+
+    response = client.post("/api/v1/auth/signup", json={**body, "department": " public works "})
+    assert response.status_code == 200
+    assert response.json()["user"]["department"] == "Public Works"
+
+
+def test_claim_lists_departments_for_an_unknown_one(client):
+    from app import database
+    # A profile from before signup validated the department
+    client.portal.call(database.get_repository().create_user, {
+        "full_name": "Test User", "phone_number": "+15550000002", "password": "pass1234",
+        "role": "employee", "department": "Roads Dept", "status": "active"
+    })
+    token = client.post("/api/v1/auth/login", json={"phone_number": "+15550000002", "password": "pass1234"})
+    headers = {"Authorization": f"Bearer {token.json()['access_token']}"}
+
+    response = client.get("/api/v1/issues/queue/next", headers=headers)
+    assert response.status_code == 400
+    assert "Public Works" in response.json()["detail"]
+
+
+def test_openapi_schema_renders(client):
+    assert client.get("/openapi.json").status_code == 200
+    assert client.get("/docs").status_code == 200
+
+
+def test_msgpack_is_negotiated(client):
+    import msgpack
+    response = client.get("/health/live", headers={"Accept": "application/msgpack"})
+    assert response.headers["content-type"] == "application/msgpack"
+    assert msgpack.unpackb(response.content) == client.get("/health/live").json()
+
+    refused = client.get("/health/live", headers={"Accept": "application/msgpack;q=0, application/json"})
+    assert refused.headers["content-type"] == "application/json"
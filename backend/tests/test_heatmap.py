@@ -0,0 +1,95 @@
+import asyncio
+import pytest
+from app.repositories.resilience import BackendUnavailable, CircuitBreaker, ResilientRepository
+from app.services.heatmap_service import IssuePointSnapshot, rasterize
+from conftest import new_issue
+
+pytestmark = pytest.mark.anyio
+
+BBOX = (77.0, 12.0, 78.0, 13.0)
+
+
+async def add_issues(repo, count, **overrides):
+    user = await repo.get_user_by_phone("+15550000001") or await repo.create_user({
+        "full_name": "Test User", "phone_number": "+15550000001", "password": "pass1234",
+        "role": "citizen", "status": "active"
+    })
+    for _ in range(count):
+        await repo.create_issue({**new_issue(**overrides), "user_id": user["id"], "status": "new"})
+
+
+async def test_snapshot_pages_and_refreshes_incrementally(repo):
+    await add_issues(repo, 5)
+    snapshot = IssuePointSnapshot(ttl=0, page_size=2)
+
+    await snapshot.refresh(repo)
+    assert len(snapshot.columns.lat) == 5
+    assert snapshot.version == 1
+
+    # Nothing new: the arrays and version (and so the render cache) are kept
+    await snapshot.refresh(repo)
+    assert len(snapshot.columns.lat) == 5
+    assert snapshot.version == 1
+
+    await add_issues(repo, 3, category="parks", location_lat=12.5, location_lng=77.5)
+    await snapshot.refresh(repo)
+    assert len(snapshot.columns.lat) == 8
+    assert snapshot.version == 2
+    assert int(rasterize(snapshot.columns, BBOX, 8, category="parks").sum()) == 3
+    assert int(rasterize(snapshot.columns, BBOX, 8).sum()) == 8
+
+
+async def test_location_pages_follow_the_keyset(repo):
+    await add_issues(repo, 5)
+    first = await repo.list_issue_locations(limit=3)
+    rest = await repo.list_issue_locations(after=(first[-1]["created_at"], first[-1]["id"]), limit=3)
+
+    assert len(first) == 3 and len(rest) == 2
+    assert {r["id"] for r in first}.isdisjoint(r["id"] for r in rest)
+
+
+async def test_snapshot_timeouts_do_not_trip_the_breaker():
+    class SlowBackend:
+        transient_errors = ()
+
+        def is_transient(self, error):
+            return False
+
+        async def list_issue_locations(self, after=None, limit=1000):
+            await asyncio.sleep(1)
+
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    repo = ResilientRepository(SlowBackend(), timeout=0.01, read_retries=1, retry_backoff=0, breaker=breaker)
+
+    with pytest.raises(BackendUnavailable):
+        await IssuePointSnapshot(ttl=0).refresh(repo)
+    assert breaker.state == "closed"
+    assert breaker.failures == 0
+
+
+def test_heatmap_endpoint_renders_json_and_png(client, monkeypatch):
+    import base64
+    from collections import OrderedDict
+    import numpy as np
+    from app.services import heatmap_service
+    from conftest import signup
+    monkeypatch.setattr(heatmap_service, "issue_points", IssuePointSnapshot(ttl=0))
+    monkeypatch.setattr(heatmap_service, "_heatmap_cache", OrderedDict())
+
+    citizen = signup(client, "+15550000001")
+    employee = signup(client, "+15550000002", role="employee", department="Public Works")
+    for _ in range(3):
+        client.post("/api/v1/issues/", json=new_issue(location_lat=12.5, location_lng=77.5), headers=citizen)
+    params = {"bbox": ",".join(map(str, BBOX)), "resolution": 8}
+
+    assert client.get("/api/v1/analytics/heatmap", params=params, headers=citizen).status_code == 403
+
+    body = client.get("/api/v1/analytics/heatmap", params=params, headers=employee).json()
+    assert body["total"] == 3
+    assert body["layout"] == "sparse"
+    counts = np.frombuffer(base64.b64decode(body["counts"]), dtype=body["dtype"])
+    assert counts.tolist() == [3]
+
+    png = client.get("/api/v1/analytics/heatmap", params={**params, "format": "png"}, headers=employee)
+    assert png.headers["content-type"] == "image/png"
+    assert png.content.startswith(b"\x89PNG")
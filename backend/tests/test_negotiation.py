@@ -0,0 +1,36 @@
+import pytest
+from app.middleware.compression import choose_encoding
+from app.middleware.negotiation import parse_accept, prefers_msgpack
+
+
+def test_parse_accept_reads_q_values():
+    assert parse_accept("application/json;q=0.5, application/msgpack") == {
+        "application/json": 0.5, "application/msgpack": 1.0
+    }
+    assert parse_accept("application/msgpack;q=oops, */*") == {"*/*": 1.0}
+
+
+@pytest.mark.parametrize("accept, expected", [
+    ("application/msgpack", True),
+    ("application/x-msgpack", True),
+    ("application/msgpack, */*;q=0.1", True),
+    ("application/msgpack;q=0", False),
+    ("application/msgpack;q=0.0, application/json", False),
+    ("application/json, application/msgpack;q=0.5", False),
+    ("application/json;q=0.5, application/msgpack", True),
+    ("application/json", False),
+    ("*/*", False),
+    ("", False),
+])
+def test_prefers_msgpack(accept, expected):
+    assert prefers_msgpack(accept) is expected
+
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    ("gzip, br", "br"),
+    ("gzip", "gzip"),
+    ("br;q=0, gzip", "gzip"),
+    ("identity", None),
+])
+def test_choose_encoding(accept_encoding, expected):
+    assert choose_encoding(accept_encoding) == expected
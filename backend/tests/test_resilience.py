@@ -0,0 +1,142 @@
+import asyncio
+import pytest
+from app.repositories import resilience
+from app.repositories.resilience import BackendUnavailable, CircuitBreaker, ResilientRepository
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(resilience.time, "monotonic", fake)
+    return fake
+
+
+def test_breaker_opens_after_threshold(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    with pytest.raises(BackendUnavailable) as error:
+        breaker.before_call()
+    assert error.value.status_code == 503
+    assert error.value.headers["Retry-After"] == "30"
+    assert breaker.rejected == 1
+
+
+def test_half_open_lets_one_trial_through(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    clock.now += 30
+    assert breaker.state == "half_open"
+
+    breaker.before_call()
+    with pytest.raises(BackendUnavailable):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    breaker.before_call()
+
+
+def test_failed_trial_reopens(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    clock.now += 30
+    breaker.before_call()
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.retry_after() == 30
+
+
+class FlakyBackend:
+    transient_errors = (OSError,)
+
+    def __init__(self, failures: int, error: Exception):
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    def is_transient(self, error: BaseException) -> bool:
+        return isinstance(error, self.transient_errors)
+
+    async def list_open_issues(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error
+        return [{"id": "1"}]
+
+    async def claim_issue(self, issue_id, employee_id, current_status, max_open):
+        self.calls += 1
+        raise self.error
+
+
+def resilient(backend, failure_threshold=5):
+    return ResilientRepository(
+        backend, timeout=1, read_retries=2, retry_backoff=0,
+        breaker=CircuitBreaker(failure_threshold, reset_timeout=30)
+    )
+
+
+async def test_reads_retry_transient_errors():
+    backend = FlakyBackend(failures=2, error=OSError("reset"))
+    repo = resilient(backend)
+
+    assert await repo.list_open_issues() == [{"id": "1"}]
+    assert backend.calls == 3
+    assert repo.breaker.failures == 0
+
+
+async def test_exhausted_retries_raise_503():
+    backend = FlakyBackend(failures=10, error=OSError("reset"))
+    repo = resilient(backend)
+
+    with pytest.raises(BackendUnavailable):
+        await repo.list_open_issues()
+    assert backend.calls == 3
+    assert repo.breaker.failures == 3
+
+
+async def test_writes_are_not_retried():
+    backend = FlakyBackend(failures=10, error=OSError("reset"))
+    repo = resilient(backend)
+
+    with pytest.raises(BackendUnavailable):
+        await repo.claim_issue("1", "employee-1", "new", 5)
+    assert backend.calls == 1
+
+
+async def test_application_errors_pass_through_without_tripping():
+    backend = FlakyBackend(failures=10, error=ValueError("bad row"))
+    repo = resilient(backend, failure_threshold=1)
+
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            await repo.list_open_issues()
+    assert repo.breaker.state == "closed"
+
+
+async def test_timeouts_count_as_failures():
+    class SlowBackend(FlakyBackend):
+        async def list_open_issues(self):
+            await asyncio.sleep(1)
+
+    repo = ResilientRepository(
+        SlowBackend(0, None), timeout=0.01, read_retries=0, retry_backoff=0,
+        breaker=CircuitBreaker(1, reset_timeout=30)
+    )
+    with pytest.raises(BackendUnavailable):
+        await repo.list_open_issues()
+    assert repo.breaker.state == "open"
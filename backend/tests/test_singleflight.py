@@ -0,0 +1,83 @@
+import asyncio
+import pytest
+from app.services.singleflight import SingleFlight
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(*(flight.do("issues", fetch) for _ in range(10)))
+
+    assert results == [1] * 10
+    assert flight.stats() == {"requests": 10, "backend_calls": 1, "collapsed": 9, "in_flight": 0}
+
+
+async def test_different_keys_are_not_collapsed():
+    flight = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0)
+        return object()
+
+    first, second = await asyncio.gather(flight.do("a", fetch), flight.do("b", fetch))
+    assert first is not second
+    assert flight.executions == 2
+
+
+async def test_failures_are_not_shared_afterwards():
+    flight = SingleFlight(window=10)
+    attempts = 0
+
+    async def fetch():
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise OSError("down")
+        return "ok"
+
+    with pytest.raises(OSError):
+        await flight.do("issues", fetch)
+    assert await flight.do("issues", fetch) == "ok"
+
+
+async def test_results_are_reused_within_window_until_forget():
+    flight = SingleFlight(window=10)
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await flight.do("issues", fetch) == 1
+    assert await flight.do("issues", fetch) == 1
+
+    flight.forget()
+    assert await flight.do("issues", fetch) == 2
+
+
+async def test_cancelled_caller_does_not_cancel_shared_call():
+    flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def fetch():
+        started.set()
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    first = asyncio.ensure_future(flight.do("issues", fetch))
+    await started.wait()
+    second = asyncio.ensure_future(flight.do("issues", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "ok"
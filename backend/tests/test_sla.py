@@ -0,0 +1,87 @@
+import asyncio
+import pytest
+from app import database
+from app.services import analytics_service
+from app.services.analytics_service import Histogram, SLARollups
+from conftest import break_backend, new_issue, signup
+
+
+@pytest.fixture
+def rollups(monkeypatch):
+    fresh = SLARollups()
+    monkeypatch.setattr(analytics_service, "sla_rollups", fresh)
+    return fresh
+
+
+def warm(client, rollups):
+    client.portal.call(rollups.warm, database.get_repository, 0)
+
+
+@pytest.fixture
+def employee(client):
+    return signup(client, "+15550000002", role="employee", department="Public Works")
+
+
+def resolve_one(client, employee):
+    citizen = signup(client, "+15550000001")
+    issue = client.post("/api/v1/issues/", json=new_issue(), headers=citizen).json()
+    for status in ("acknowledged", "resolved"):
+        response = client.put(f"/api/v1/issues/{issue['id']}", json={"status": status}, headers=employee)
+        assert response.status_code == 200, response.text
+
+
+def test_histogram_percentiles_stay_within_observed_range():
+    histogram = Histogram()
+    for seconds in (30, 90, 600, 7200):
+        histogram.add(seconds)
+
+    summary = histogram.summary()
+    assert summary["count"] == 4
+    assert summary["p50_seconds"] <= summary["p90_seconds"] <= summary["max_seconds"] == 7200
+
+
+def test_sla_report_counts_transitions(client, rollups, employee):
+    warm(client, rollups)
+    resolve_one(client, employee)
+
+    report = client.get("/api/v1/analytics/sla", headers=employee).json()
+    [group] = report["groups"]
+    assert group["category"] == "roads"
+    assert group["time_to_acknowledge"]["count"] == 1
+    assert group["time_to_resolve"]["count"] == 1
+
+
+def test_sla_report_is_503_until_warmed_up(client, rollups, employee):
+    response = client.get("/api/v1/analytics/sla", headers=employee)
+    assert response.status_code == 503
+    assert "retry-after" in response.headers
+
+    warm(client, rollups)
+    assert client.get("/api/v1/analytics/sla", headers=employee).status_code == 200
+
+
+def test_lifespan_warms_the_rollups(rollups, monkeypatch, tmp_path):
+    from fastapi.testclient import TestClient
+    from app import main
+    monkeypatch.setattr(main, "sla_rollups", rollups)
+    monkeypatch.setattr(main.settings, "DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path}/warm.db")
+
+    with TestClient(main.app) as client:
+        for _ in range(100):
+            if rollups.caught_up:
+                break
+            client.portal.call(asyncio.sleep, 0.01)
+        assert rollups.caught_up
+
+
+def test_sla_report_is_flagged_stale_when_refresh_fails(client, rollups, employee):
+    warm(client, rollups)
+    resolve_one(client, employee)
+    assert "x-data-stale" not in client.get("/api/v1/analytics/sla", headers=employee).headers
+
+    break_backend("list_status_events")
+
+    response = client.get("/api/v1/analytics/sla", headers=employee)
+    assert response.status_code == 200
+    assert response.headers["x-data-stale"] == "true"
+    assert response.json()["groups"][0]["time_to_resolve"]["count"] == 1
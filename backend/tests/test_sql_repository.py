@@ -0,0 +1,116 @@
+from datetime import datetime, timezone
+import pytest
+from app.repositories.base import OpenLimitReached
+from conftest import new_issue
+
+pytestmark = pytest.mark.anyio
+
+
+async def make_user(repo, phone_number="+15550000001", **fields):
+    return await repo.create_user({
+        "full_name": "Test User",
+        "phone_number": phone_number,
+        "password": "pass1234",
+        "role": "citizen",
+        "status": "active",
+        **fields
+    })
+
+
+async def test_users_round_trip(repo):
+    user = await make_user(repo)
+
+    assert (await repo.get_user_by_id(user["id"]))["phone_number"] == "+15550000001"
+    assert (await repo.get_user_by_phone("+15550000001"))["id"] == user["id"]
+    assert await repo.get_user_by_phone("+15559999999") is None
+
+
+async def test_issues_carry_reporter_and_filter(repo):
+    user = await make_user(repo)
+    roads = await repo.create_issue({**new_issue(), "user_id": user["id"], "status": "new"})
+    await repo.create_issue({**new_issue(category="parks"), "user_id": user["id"], "status": "new"})
+
+    assert roads["reporter_name"] == "Test User"
+    assert roads["reporter_phone"] == "+15550000001"
+    assert len(await repo.list_issues()) == 2
+    assert [i["id"] for i in await repo.list_issues(category="roads")] == [roads["id"]]
+    assert await repo.list_issues(status="resolved") == []
+
+    updated = await repo.update_issue(roads["id"], {"status": "resolved"})
+    assert updated["status"] == "resolved"
+    assert await repo.update_issue("missing", {"status": "resolved"}) is None
+    assert len(await repo.list_open_issues()) == 1
+
+
+async def test_votes_and_comments(repo):
+    user = await make_user(repo)
+    issue = await repo.create_issue({**new_issue(), "user_id": user["id"], "status": "new"})
+
+    await repo.create_vote({"user_id": user["id"], "issue_id": issue["id"], "vote_type": "upvote"})
+    assert (await repo.get_vote(issue["id"], user["id"]))["vote_type"] == "upvote"
+    assert await repo.count_user_votes(user["id"]) == 1
+    assert (await repo.list_open_issues())[0]["upvotes"] == 1
+
+    comment = await repo.create_comment({"issue_id": issue["id"], "user_id": user["id"], "content": "Seen it"})
+    assert comment["commenter_name"] == "Test User"
+    assert [c["id"] for c in await repo.list_comments(issue["id"])] == [comment["id"]]
+
+
+async def test_claim_is_compare_and_set(repo):
+    user = await make_user(repo)
+    issue = await repo.create_issue({**new_issue(), "user_id": user["id"], "status": "new"})
+
+    claimed = await repo.claim_issue(issue["id"], "employee-1", "new", 5)
+    assert claimed["assigned_to"] == "employee-1"
+    assert claimed["status"] == "acknowledged"
+
+    # Already taken, and the queued status no longer matches
+    assert await repo.claim_issue(issue["id"], "employee-2", "new", 5) is None
+    assert (await repo.get_issue(issue["id"]))["assigned_to"] == "employee-1"
+
+
+async def test_claim_keeps_later_statuses(repo):
+    user = await make_user(repo)
+    issue = await repo.create_issue({**new_issue(), "user_id": user["id"], "status": "new"})
+    await repo.update_issue(issue["id"], {"status": "in_progress"})
+
+    # A stale queued status must not win
+    assert await repo.claim_issue(issue["id"], "employee-1", "new", 5) is None
+
+    claimed = await repo.claim_issue(issue["id"], "employee-1", "in_progress", 5)
+    assert claimed["status"] == "in_progress"
+
+
+async def test_claim_enforces_the_open_issue_cap(repo):
+    user = await make_user(repo)
+    employee = await make_user(repo, "+15550000002", role="employee", department="Public Works")
+    first, second = [
+        await repo.create_issue({**new_issue(), "user_id": user["id"], "status": "new"}) for _ in range(2)
+    ]
+
+    assert await repo.claim_issue(first["id"], employee["id"], "new", 1)
+    with pytest.raises(OpenLimitReached):
+        await repo.claim_issue(second["id"], employee["id"], "new", 1)
+    assert (await repo.get_issue(second["id"]))["assigned_to"] is None
+
+    # Resolved issues no longer count against the cap
+    await repo.update_issue(first["id"], {"status": "resolved"})
+    assert await repo.claim_issue(second["id"], employee["id"], "new", 1)
+
+
+async def test_status_events_page_in_id_order(repo):
+    user = await make_user(repo)
+    issue = await repo.create_issue({**new_issue(), "user_id": user["id"], "status": "new"})
+    for to_status in ("acknowledged", "in_progress", "resolved"):
+        await repo.record_status_event({
+            "issue_id": issue["id"],
+            "to_status": to_status,
+            "category": "roads",
+            "priority": "medium",
+            "issue_created_at": issue["created_at"],
+            "changed_at": datetime.now(timezone.utc)
+        })
+
+    first = await repo.list_status_events(limit=2)
+    rest = await repo.list_status_events(after_id=first[-1]["id"], limit=2)
+    assert [e["to_status"] for e in first + rest] == ["acknowledged", "in_progress", "resolved"]
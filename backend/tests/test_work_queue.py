@@ -0,0 +1,80 @@
+import pytest
+from fastapi import HTTPException
+from app.repositories.resilience import BackendUnavailable
+from app.services.work_queue import WorkQueues
+from conftest import new_issue
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def citizen(repo):
+    return await repo.create_user({
+        "full_name": "Test User", "phone_number": "+15550000001", "password": "pass1234",
+        "role": "citizen", "status": "active"
+    })
+
+
+async def test_claims_follow_priority_then_age(repo, citizen):
+    low = await repo.create_issue({**new_issue(priority="low"), "user_id": citizen["id"], "status": "new"})
+    high = await repo.create_issue({**new_issue(priority="high"), "user_id": citizen["id"], "status": "new"})
+    await repo.create_issue({**new_issue(category="parks", priority="critical"), "user_id": citizen["id"], "status": "new"})
+    queues = WorkQueues(refresh_seconds=60, max_open_per_employee=5)
+
+    queued, claimed = await queues.claim(repo, "employee-1", "Public Works")
+    assert claimed["id"] == high["id"]
+    assert queued["status"] == "new"
+
+    _, claimed = await queues.claim(repo, "employee-1", " public works ")
+    assert claimed["id"] == low["id"]
+    assert await queues.claim(repo, "employee-1", "Public Works") is None
+
+
+async def test_failed_claim_keeps_the_issue_queued(repo, citizen, monkeypatch):
+    issue = await repo.create_issue({**new_issue(), "user_id": citizen["id"], "status": "new"})
+    queues = WorkQueues(refresh_seconds=60, max_open_per_employee=5)
+    await queues.ensure_loaded(repo)
+
+    claim_issue = repo.claim_issue
+
+    async def unavailable(*args, **kwargs):
+        raise BackendUnavailable()
+
+    monkeypatch.setattr(repo, "claim_issue", unavailable)
+    with pytest.raises(BackendUnavailable):
+        await queues.claim(repo, "employee-1", "Public Works")
+    assert [i["id"] for i in queues.peek("Public Works")] == [issue["id"]]
+
+    monkeypatch.setattr(repo, "claim_issue", claim_issue)
+    _, claimed = await queues.claim(repo, "employee-1", "Public Works")
+    assert claimed["id"] == issue["id"]
+    assert queues.peek("Public Works") == []
+
+
+async def test_cap_is_counted_in_the_backend(repo, citizen):
+    first = await repo.create_issue({**new_issue(), "user_id": citizen["id"], "status": "new"})
+    second = await repo.create_issue({**new_issue(), "user_id": citizen["id"], "status": "new"})
+    # Two workers, each with its own queues and no knowledge of the other's claims
+    worker_a = WorkQueues(refresh_seconds=60, max_open_per_employee=1)
+    worker_b = WorkQueues(refresh_seconds=60, max_open_per_employee=1)
+    await worker_b.ensure_loaded(repo)
+
+    _, claimed = await worker_a.claim(repo, "employee-1", "Public Works")
+    assert claimed["id"] == first["id"]
+
+    with pytest.raises(HTTPException) as exc:
+        await worker_b.claim(repo, "employee-1", "Public Works")
+    assert exc.value.status_code == 409
+    assert second["id"] in [i["id"] for i in worker_b.peek("Public Works")]
+
+
+async def test_lost_race_drops_the_issue(repo, citizen):
+    issue = await repo.create_issue({**new_issue(), "user_id": citizen["id"], "status": "new"})
+    queues = WorkQueues(refresh_seconds=60, max_open_per_employee=5)
+    await queues.ensure_loaded(repo)
+
+    # Another worker claims it first
+    await repo.claim_issue(issue["id"], "employee-2", "new", 5)
+
+    assert await queues.claim(repo, "employee-1", "Public Works") is None
+    assert queues.peek("Public Works") == []